@@ -5,10 +5,12 @@ import threading
 import time
 import shutil
 from queue import Queue, Empty
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, date
 import pytz
+import numpy as np
 import pandas as pd
-from jira import JIRA
+import requests
 from dateutil import parser
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
@@ -16,6 +18,19 @@ import webbrowser  # 웹 브라우저 열기 위한 모듈 추가
 import re
 from tkcalendar import DateEntry  # 날짜 선택 위젯 추가
 import traceback  # 예외 추적을 위한 모듈 추가
+import argparse  # 캐시 서버 모드 실행 옵션
+import hmac  # 웹훅 서명 확인
+import hashlib
+from urllib.parse import urlparse, parse_qs
+try:
+    import orjson  # 빠른 JSON 파서 (설치된 경우에만 사용)
+except ImportError:
+    orjson = None
+try:
+    import pyarrow.feather as feather  # 최근 실행 결과 저장용 (설치된 경우에만 사용)
+except ImportError:
+    feather = None
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler  # 웹훅 수신용 HTTP 서버
 
 # PyInstaller 환경에서의 리소스 경로 처리 함수 # test push
 def resource_path(relative_path):
@@ -92,6 +107,55 @@ def extract_swarm_link(comment):
     match = pattern.search(comment)
     return match.group(1) if match else ''
 
+# 시간대 및 시간 형식 (KST 기준)
+KST = pytz.timezone('Asia/Seoul')
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# 날짜 형식 감지 및 변환 함수
+def format_if_date(value):
+    if not isinstance(value, str):
+        return value
+    try:
+        dt = parser.parse(value)
+        return dt.strftime(TIME_FORMAT)
+    except (ValueError, TypeError):
+        return value
+
+# 저장/전송용 문자열 변환 함수
+def value_to_text(value, missing=''):
+    """날짜는 TIME_FORMAT 문자열로, 결측값은 missing으로, 나머지는 str로 바꿉니다."""
+    if isinstance(value, (pd.Timestamp, datetime)) and not pd.isna(value):
+        return value.strftime(TIME_FORMAT)
+    if pd.isna(value):
+        return missing
+    return str(value)
+
+# 변경 이력 행 생성 함수
+def make_change_row(issue_key, issue_type, issue_summary, field, from_value, to_value, changed_at, author, assignee,
+                    jira_url, from_url='', to_url='', committer='', swarm_link=''):
+    """
+    결과 DataFrame의 한 행(변경 이력 1건)을 만듭니다.
+    changed_at은 KST 기준 datetime 또는 TIME_FORMAT 문자열입니다.
+    """
+    if isinstance(changed_at, datetime):
+        changed_at = changed_at.strftime(TIME_FORMAT)
+    return {
+        '# 키': issue_key,
+        '유형': issue_type,
+        '요약': issue_summary,
+        '이슈 필드': field,
+        '변경 전 내용': from_value,
+        '변경 후 내용': to_value,
+        '변경 시간': changed_at,
+        '변경한 사람': author,
+        '담당자': assignee,
+        '이슈 URL': f"{jira_url}/browse/{issue_key}",
+        '변경 전 내용 URL': from_url if from_url else '',
+        '변경 후 내용 URL': to_url if to_url else '',
+        'Committer': committer,
+        'Swarm Link': swarm_link
+    }
+
 # 자격 증명 파일에서 인증 정보 가져오기
 def load_jira_credentials():
     credentials_path = os.path.join(os.getcwd(), 'jira_credentials.json')
@@ -118,12 +182,69 @@ else:
     JIRA_USERNAME = None
     JIRA_API_TOKEN = None
 
+# 결과 표의 정렬/필터 캐시
+class ResultGridModel:
+    """
+    결과 표에 표시할 DataFrame의 컬럼별 범주 코드(정렬된 고유값 기준)와 정렬 인덱스를 한 번만 계산해 캐시합니다.
+    정렬은 캐시된 argsort 인덱스로, 값 필터와 키워드 검색은 고유값에 대해서만 비교한 뒤 코드로 펼쳐서 처리합니다.
+    """
+    def __init__(self, df):
+        self.df = df.reset_index(drop=True)
+        self.categories = {}  # 컬럼 -> (코드 배열, 정렬된 고유 문자열)
+        self.sort_indexes = {}  # 컬럼 -> 오름차순 argsort 인덱스
+
+    def category(self, col):
+        if col not in self.categories:
+            # 화면에 보이는 문자열 기준으로 범주화 (변경 시간 문자열은 사전순이 곧 시간순)
+            codes, uniques = pd.factorize(self.df[col].astype(str), sort=True)
+            self.categories[col] = (codes, pd.Index(uniques, dtype=object))
+        return self.categories[col]
+
+    def sort_index(self, col):
+        if col not in self.sort_indexes:
+            codes, _ = self.category(col)
+            self.sort_indexes[col] = np.argsort(codes, kind='stable')
+        return self.sort_indexes[col]
+
+    def distinct_values(self, col):
+        return list(self.category(col)[1])
+
+    def mask(self, keywords=(), filters=None):
+        """키워드(모든 키워드가 어느 한 컬럼에 포함)와 컬럼 값 필터를 만족하는 행의 불리언 마스크를 반환합니다."""
+        mask = np.ones(len(self.df), dtype=bool)
+        for col, value in (filters or {}).items():
+            codes, uniques = self.category(col)
+            matches = uniques == value
+            mask &= matches[codes] if matches.any() else False
+        for kw in keywords:
+            kw_mask = np.zeros(len(self.df), dtype=bool)
+            for col in self.df.columns:
+                codes, uniques = self.category(col)
+                matches = np.asarray(uniques.str.contains(kw, case=False, regex=False), dtype=bool)
+                kw_mask |= matches[codes]
+            mask &= kw_mask
+        return mask
+
+    def view(self, sort_column=None, ascending=True, keywords=(), filters=None):
+        """정렬과 필터를 적용한 DataFrame을 반환합니다."""
+        if sort_column is None:
+            order = np.arange(len(self.df))
+        else:
+            order = self.sort_index(sort_column)
+            if not ascending:
+                order = order[::-1]
+        if keywords or filters:
+            order = order[self.mask(keywords, filters)[order]]
+        return self.df.iloc[order]
+
+TREEVIEW_PAGE_SIZE = 500  # 결과 표에 한 번에 넣는 행 수 (스크롤이 끝에 닿으면 다음 행을 이어서 넣음)
+
 # 1. GUI 설정
 class JiraTrackerApp:
     def __init__(self, root):
         self.root = root
         self.root.title("JIRA Issue Tracker")
-        self.root.geometry("400x700")  # 높이를 늘려줍니다.
+        self.root.geometry("400x850")  # 높이를 늘려줍니다.
 
         # 초기 실행 시 자격 증명 확인
         if not credentials:
@@ -217,7 +338,36 @@ class JiraTrackerApp:
         # Export 버튼
         ttk.Button(self.root, text="Export", command=self.export_results).pack(pady=10)
 
+        # 웹훅 수신 버튼
+        self.webhook_button_text = tk.StringVar(value="웹훅 수신 시작")
+        ttk.Button(self.root, textvariable=self.webhook_button_text, command=self.toggle_webhook_listener).pack(pady=10)
+
+        # 최근 실행 결과 버튼
+        ttk.Button(self.root, text="최근 실행", command=self.show_recent_runs).pack(pady=10)
+
+        # 일괄 리포트 버튼 (담당자/변경한 사람 목록을 한 번의 수집으로 처리)
+        ttk.Button(self.root, text="일괄 리포트", command=self.run_batch_report).pack(pady=10)
+
         self.df = None  # 결과를 저장할 DataFrame
+        self.rollups = None  # 결과에 대한 집계(롤업) 캐시
+        self.timeline = None  # 시점 조회용 필드 이력 인덱스
+        self.grid_model = None  # 결과 표의 정렬 인덱스/필터 값 캐시
+        self.webhook_listener = None  # 실행 중인 웹훅 수신 서버
+
+        # 마지막 실행 결과를 바로 불러옴 (웜 스타트)
+        recent_runs = load_recent_runs_index()
+        if recent_runs:
+            try:
+                self.set_results(load_recent_run(recent_runs[0]))
+            except Exception as e:
+                print(f"최근 실행 결과 로드 중 오류 발생: {e}")
+
+    def set_results(self, df, rollups=None):
+        """결과 DataFrame을 바꾸고 결과에 딸린 캐시를 초기화합니다. 집계는 주어지지 않으면 필요할 때 계산합니다."""
+        self.df = df
+        self.rollups = rollups
+        self.timeline = None
+        self.grid_model = None
 
     def on_date_change(self, event):
         # 지정 날짜가 오늘 날짜와 다르면 날짜가 선택된 것으로 간주
@@ -231,27 +381,38 @@ class JiraTrackerApp:
             # 조회 범위 (시간) 입력 필드 활성화
             self.hours_entry.configure(state='normal')
 
-    def run_tracker(self):
+    def read_query_window(self):
+        """입력된 조회 범위(시간)와 지정 날짜를 읽습니다. 입력이 잘못되면 None을 반환합니다."""
         if not self.date_selected:
             try:
                 hours = float(self.hours_entry.get())
             except ValueError:
                 messagebox.showerror("입력 오류", "조회 범위를 숫자로 입력해야 합니다.")
-                return
+                return None
             selected_date = None
         else:
             hours = None  # 지정 날짜가 선택된 경우 조회 범위는 사용하지 않음
             selected_date = self.date_entry.get_date()
+        return hours, selected_date
+
+    def show_running_popup(self):
+        self.running_popup = tk.Toplevel(self.root)
+        self.running_popup.title("실행 중")
+        self.running_popup.geometry("200x100")
+        ttk.Label(self.running_popup, text="실행 중입니다...잠시만 기다려주세요.").pack(expand=True)
+
+    def run_tracker(self):
+        query_window = self.read_query_window()
+        if query_window is None:
+            return
+        hours, selected_date = query_window
 
         assignee_name = self.assignee_entry.get().strip()
         author_name = self.author_entry.get().strip()
         all_issues = self.all_issues_var.get()
 
         # 실행 중 팝업
-        self.running_popup = tk.Toplevel(self.root)
-        self.running_popup.title("실행 중")
-        self.running_popup.geometry("200x100")
-        ttk.Label(self.running_popup, text="실행 중입니다...잠시만 기다려주세요.").pack(expand=True)
+        self.show_running_popup()
 
         # 백그라운드 스레드에서 실행
         thread = threading.Thread(target=self.run_tracker_thread, args=(hours, all_issues, assignee_name, author_name, selected_date))
@@ -259,8 +420,26 @@ class JiraTrackerApp:
 
     def run_tracker_thread(self, hours, all_issues_flag, assignee_name, author_name, selected_date):
         try:
-            self.df = run_jira_tracker(hours, all_issues_flag, assignee_name, author_name, selected_date)
+            # 공유 캐시 서버가 설정되어 있으면 서버에 먼저 조회하고, 캐시 범위를 벗어나면 JIRA에서 직접 수집
+            current_credentials = load_jira_credentials() or {}
+            server_url = current_credentials.get('TRACKER_SERVER_URL')
+            self.df = None
+            if server_url and not all_issues_flag:
+                self.df = query_tracker_server(server_url, hours, assignee_name, author_name, selected_date,
+                                               current_credentials.get('TRACKER_SERVER_TOKEN'))
+            if self.df is None:
+                self.df = run_jira_tracker(hours, all_issues_flag, assignee_name, author_name, selected_date)
+            # 결과가 바뀌었으므로 집계를 다시 계산
+            self.set_results(self.df, ChangeRollups(self.df) if self.df is not None and not self.df.empty else None)
             if self.df is not None and not self.df.empty:
+                # 다음 실행 때 바로 열 수 있도록 결과 저장
+                save_recent_run(self.df, {
+                    'hours': hours,
+                    'all_issues': all_issues_flag,
+                    'assignee': assignee_name,
+                    'author': author_name,
+                    'date': selected_date.isoformat() if selected_date else None
+                })
                 n = len(self.df)  # 수집된 이력의 개수 계산
                 message = f"JIRA 변경 사항 추적이 완료되었습니다.\n총 {n}개 이력이 수집되었습니다."
                 self.root.after(0, lambda: messagebox.showinfo("완료", message))
@@ -270,55 +449,271 @@ class JiraTrackerApp:
             # 예외의 전체 정보를 출력하도록 수정
             error_message = ''.join(traceback.format_exception(None, e, e.__traceback__))
             self.root.after(0, lambda: messagebox.showerror("오류", f"오류가 발생했습니다:\n{error_message}"))
-            self.df = None
+            self.set_results(None)
         finally:
             self.running_popup.destroy()
 
+    def run_batch_report(self):
+        """
+        담당자/변경한 사람 목록(쉼표로 구분, 비어 있으면 팀 파일)을 받아
+        한 번만 수집한 뒤 사람별 리포트를 저장합니다.
+        """
+        query_window = self.read_query_window()
+        if query_window is None:
+            return
+        hours, selected_date = query_window
+
+        assignees = split_names(self.assignee_entry.get())
+        authors = split_names(self.author_entry.get())
+        if not assignees and not authors:
+            team_file = filedialog.askopenfilename(title="팀 파일 선택", filetypes=[("Team files", "*.json *.txt")])
+            if not team_file:
+                return
+            try:
+                assignees, authors = load_team_file(team_file)
+            except Exception as e:
+                messagebox.showerror("파일 오류", f"팀 파일을 읽지 못했습니다:\n{e}")
+                return
+            if not assignees and not authors:
+                messagebox.showerror("파일 오류", "팀 파일에 담당자나 변경한 사람이 없습니다.")
+                return
+
+        single_workbook = messagebox.askyesnocancel(
+            "저장 방식", "하나의 통합 문서에 사람별 시트로 저장할까요?\n(아니요를 누르면 사람별 파일로 저장합니다.)")
+        if single_workbook is None:
+            return
+        if single_workbook:
+            output_path = filedialog.asksaveasfilename(defaultextension=".xlsx", filetypes=[("Excel files", "*.xlsx")])
+        else:
+            output_path = filedialog.askdirectory(title="리포트를 저장할 폴더 선택")
+        if not output_path:
+            return
+
+        all_issues = self.all_issues_var.get()
+        self.show_running_popup()
+        thread = threading.Thread(target=self.run_batch_report_thread,
+                                  args=(hours, all_issues, assignees, authors, selected_date, output_path, single_workbook))
+        thread.start()
+
+    def run_batch_report_thread(self, hours, all_issues_flag, assignees, authors, selected_date, output_path, single_workbook):
+        try:
+            # 사람 조건 없이 한 번만 수집
+            df = run_jira_tracker(hours, all_issues_flag, '', '', selected_date)
+            if df is None or df.empty:
+                self.root.after(0, lambda: messagebox.showinfo("완료", "조건에 해당하는 변경 사항이 없습니다."))
+                return
+            self.set_results(df, ChangeRollups(df))
+            save_recent_run(df, {
+                'hours': hours,
+                'all_issues': all_issues_flag,
+                'assignee': ', '.join(assignees),
+                'author': ', '.join(authors),
+                'date': selected_date.isoformat() if selected_date else None
+            })
+
+            reports = split_reports(df, assignees, authors)
+            write_reports(reports, output_path, single_workbook)
+            message = f"{len(reports)}개 리포트가 {output_path}에 저장되었습니다.\n총 {len(df)}개 이력이 수집되었습니다."
+            self.root.after(0, lambda: messagebox.showinfo("완료", message))
+        except Exception as e:
+            error_message = ''.join(traceback.format_exception(None, e, e.__traceback__))
+            self.root.after(0, lambda: messagebox.showerror("오류", f"오류가 발생했습니다:\n{error_message}"))
+        finally:
+            self.running_popup.destroy()
+
+    def toggle_webhook_listener(self):
+        """로컬 웹훅 수신 서버를 시작하거나 중지합니다."""
+        if self.webhook_listener is not None:
+            self.webhook_listener.stop()
+            self.webhook_listener = None
+            self.webhook_button_text.set("웹훅 수신 시작")
+            return
+
+        current_credentials = load_jira_credentials()
+        if not current_credentials or not current_credentials.get('JIRA_URL'):
+            messagebox.showerror("오류", "jira_credentials.json 파일에 JIRA_URL을 설정해주세요.")
+            return
+        try:
+            fields_to_track = load_fields_to_track()
+            host = current_credentials.get('WEBHOOK_HOST', WEBHOOK_HOST)
+            port = int(current_credentials.get('WEBHOOK_PORT', WEBHOOK_PORT))
+            self.webhook_listener = JiraWebhookListener(
+                self.on_webhook_changes, current_credentials['JIRA_URL'], fields_to_track, host, port,
+                current_credentials.get('WEBHOOK_SECRET'))
+            self.webhook_listener.start()
+        except Exception as e:
+            self.webhook_listener = None
+            messagebox.showerror("오류", f"웹훅 수신 서버를 시작하지 못했습니다:\n{e}")
+            return
+
+        host, port = self.webhook_listener.address
+        self.webhook_button_text.set("웹훅 수신 중지")
+        messagebox.showinfo("웹훅 수신", f"http://{host}:{port}/ 에서 JIRA 웹훅을 수신합니다.")
+
+    def on_webhook_changes(self, changes):
+        """웹훅 수신 스레드에서 호출됩니다. 결과 갱신은 GUI 스레드에서 수행합니다."""
+        new_df = changes_to_dataframe(changes)
+        self.root.after(0, lambda: self.append_changes(new_df))
+
+    def append_changes(self, new_df):
+        """새 변경 이력을 결과에 덧붙이고 집계를 증분 갱신합니다."""
+        if new_df is None or new_df.empty:
+            return
+        if self.df is None or self.df.empty:
+            self.df = new_df
+        else:
+            self.df = pd.concat([self.df, new_df], ignore_index=True)
+        if self.rollups is None:
+            self.rollups = ChangeRollups(self.df)
+        else:
+            self.rollups.update(new_df)
+        # 시점 조회 인덱스는 다음 조회 때 다시 만듦
+        self.timeline = None
+        self.grid_model = None
+
+    def show_recent_runs(self):
+        """저장된 최근 실행 결과 목록을 보여주고, 선택한 결과를 불러옵니다."""
+        recent_runs = load_recent_runs_index()
+        if not recent_runs:
+            messagebox.showinfo("최근 실행", "저장된 실행 결과가 없습니다.")
+            return
+
+        recent_window = tk.Toplevel(self.root)
+        recent_window.title("최근 실행")
+        recent_window.geometry("600x300")
+
+        listbox = tk.Listbox(recent_window)
+        listbox.pack(expand=True, fill='both', padx=10, pady=5)
+        for run in recent_runs:
+            params = run['params']
+            if params.get('date'):
+                window = f"{params['date']}부터"
+            elif params.get('all_issues'):
+                window = "전체 이슈"
+            else:
+                window = f"최근 {params.get('hours')}시간"
+            listbox.insert('end', f"{run['saved_at']}  |  {window}  |  담당자: {params.get('assignee') or '-'}"
+                                  f"  |  변경한 사람: {params.get('author') or '-'}  |  {run['rows']}건")
+
+        def open_selected():
+            selection = listbox.curselection()
+            if not selection:
+                return
+            try:
+                self.set_results(load_recent_run(recent_runs[selection[0]]))
+            except Exception as e:
+                messagebox.showerror("오류", f"실행 결과를 불러오지 못했습니다:\n{e}")
+                return
+            recent_window.destroy()
+            self.show_results()
+
+        ttk.Button(recent_window, text="열기", command=open_selected).pack(pady=5)
+        listbox.bind('<Double-Button-1>', lambda event: open_selected())
+
     def show_results(self):
         if self.df is not None and not self.df.empty:
             # 표시할 컬럼만 선택 (Committer, Swarm Link, 담당자 추가)
             display_columns = ['# 키', '유형', '요약', '이슈 필드', '변경 전 내용', '변경 후 내용', '변경 시간', '변경한 사람', '담당자', 'Committer', 'Swarm Link']
-            display_df = self.df[display_columns]
 
-            # 모든 결측값(NaN, NaT, None)을 '-'로 대체
-            display_df = display_df.fillna('-')
+            # 정렬 인덱스와 컬럼별 고유값은 결과마다 한 번만 계산 (결측값은 '-'로 표시)
+            if self.grid_model is None:
+                self.grid_model = ResultGridModel(self.df[display_columns].fillna('-'))
+            grid = self.grid_model
+            view_state = {'sort_column': None, 'ascending': True, 'keywords': [], 'filters': {}}
 
             # 팝업 창에 결과 표시
             result_window = tk.Toplevel(self.root)
             result_window.title("변경 사항 결과")
             result_window.geometry("1800x800")  # 충분한 크기로 조정
 
+            # 탭 구성: 변경 사항 목록 / 피벗
+            notebook = ttk.Notebook(result_window)
+            notebook.pack(expand=True, fill='both')
+            changes_tab = ttk.Frame(notebook)
+            notebook.add(changes_tab, text="변경 사항")
+
             # 검색 프레임 추가
-            search_frame = ttk.Frame(result_window)
+            search_frame = ttk.Frame(changes_tab)
             search_frame.pack(side='top', fill='x', padx=10, pady=5)
 
             ttk.Label(search_frame, text="검색어:").pack(side='left', padx=5)
             search_entry = ttk.Entry(search_frame)
             search_entry.pack(side='left', fill='x', expand=True, padx=5)
 
+            def show_row_count():
+                row_count_label.configure(text=f"{tree.loaded_rows:,} / {len(tree.pending_rows):,}행 표시")
+
+            def refresh_view():
+                # 검색어, 컬럼 필터, 정렬을 모두 적용해 Treeview 갱신 (첫 페이지만 삽입)
+                rows = grid.view(view_state['sort_column'], view_state['ascending'],
+                                 view_state['keywords'], view_state['filters'])
+                self.update_treeview(tree, rows)
+                tree.yview_moveto(0)
+                show_row_count()
+
             def search():
                 query = search_entry.get().strip()
                 if not query:
                     # 검색어가 비어있으면 전체 데이터 로드
-                    self.update_treeview(tree, display_df)
+                    view_state['keywords'] = []
+                    refresh_view()
                     return
                 # 쉼표로 키워드 분리 및 공백 제거
                 keywords = [kw.strip() for kw in query.split(',') if kw.strip()]
                 if not keywords:
                     messagebox.showinfo("가이드", "유효한 검색어를 입력해주세요. 다중 검색은 ,로 구분합니다.")
                     return
-                filtered_df = display_df.copy()
-                for kw in keywords:
-                    filtered_df = filtered_df[
-                        filtered_df.apply(lambda row: row.astype(str).str.contains(kw, case=False).any(), axis=1)
-                    ]
-                # Treeview 업데이트
-                self.update_treeview(tree, filtered_df)
+                view_state['keywords'] = keywords
+                refresh_view()
 
             ttk.Button(search_frame, text="검색", command=search).pack(side='left', padx=5)
 
+            # 컬럼 값 필터 프레임 추가
+            filter_frame = ttk.Frame(changes_tab)
+            filter_frame.pack(side='top', fill='x', padx=10, pady=5)
+
+            all_values = '(전체)'
+            ttk.Label(filter_frame, text="필터 컬럼:").pack(side='left', padx=5)
+            filter_column_combo = ttk.Combobox(filter_frame, values=display_columns, state='readonly')
+            filter_column_combo.pack(side='left', padx=5)
+            ttk.Label(filter_frame, text="값:").pack(side='left', padx=5)
+            filter_value_combo = ttk.Combobox(filter_frame, state='readonly', width=60)
+            filter_value_combo.pack(side='left', padx=5)
+            filter_status = ttk.Label(filter_frame, text="")
+            filter_status.pack(side='left', padx=5)
+
+            def show_filter_status():
+                filter_status.configure(text=', '.join(f"{col}={value}" for col, value in view_state['filters'].items()))
+
+            def on_filter_column_selected(event=None):
+                col = filter_column_combo.get()
+                filter_value_combo['values'] = [all_values] + grid.distinct_values(col)
+                filter_value_combo.set(view_state['filters'].get(col, all_values))
+
+            def on_filter_value_selected(event=None):
+                col = filter_column_combo.get()
+                value = filter_value_combo.get()
+                if value == all_values:
+                    view_state['filters'].pop(col, None)
+                else:
+                    view_state['filters'][col] = value
+                show_filter_status()
+                refresh_view()
+
+            def clear_filters():
+                view_state['filters'].clear()
+                filter_value_combo.set(all_values)
+                show_filter_status()
+                refresh_view()
+
+            filter_column_combo.bind("<<ComboboxSelected>>", on_filter_column_selected)
+            filter_value_combo.bind("<<ComboboxSelected>>", on_filter_value_selected)
+            ttk.Button(filter_frame, text="필터 초기화", command=clear_filters).pack(side='left', padx=5)
+            row_count_label = ttk.Label(filter_frame, text="")
+            row_count_label.pack(side='right', padx=5)
+
             # Treeview와 스크롤바를 포함할 프레임 생성
-            tree_frame = ttk.Frame(result_window)
+            tree_frame = ttk.Frame(changes_tab)
             tree_frame.pack(expand=True, fill='both', padx=10, pady=5)
 
             # Treeview 생성
@@ -328,15 +723,34 @@ class JiraTrackerApp:
             # 스크롤바 추가
             vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
             vsb.pack(side='right', fill='y')
-            hsb = ttk.Scrollbar(result_window, orient="horizontal", command=tree.xview)
+            hsb = ttk.Scrollbar(changes_tab, orient="horizontal", command=tree.xview)
             hsb.pack(side='bottom', fill='x')
-            tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+
+            def on_tree_scroll(first, last):
+                # 스크롤이 끝 부근에 닿으면 남은 행을 다음 페이지만큼 이어서 삽입
+                vsb.set(first, last)
+                if float(last) >= 0.95 and self.load_more_rows(tree):
+                    show_row_count()
+
+            tree.configure(yscrollcommand=on_tree_scroll, xscrollcommand=hsb.set)
 
             # 컬럼 정의
             tree['columns'] = display_columns
 
+            def sort_by(col):
+                # 같은 컬럼을 다시 누르면 정렬 방향을 바꿈
+                if view_state['sort_column'] == col:
+                    view_state['ascending'] = not view_state['ascending']
+                else:
+                    view_state['sort_column'] = col
+                    view_state['ascending'] = True
+                for c in display_columns:
+                    arrow = (' ▲' if view_state['ascending'] else ' ▼') if c == col else ''
+                    tree.heading(c, text=c + arrow)
+                refresh_view()
+
             for col in display_columns:
-                tree.heading(col, text=col, anchor=tk.W)
+                tree.heading(col, text=col, anchor=tk.W, command=lambda c=col: sort_by(c))
                 tree.column(col, anchor=tk.W, width=200)  # 넓이를 충분히 설정
 
             # 스타일 정의
@@ -366,27 +780,158 @@ class JiraTrackerApp:
             tree.tag_configure('bold', font=bold_font)
 
             # Treeview 초기 데이터 채우기
-            self.update_treeview(tree, display_df)
+            refresh_view()
 
             # 이벤트 바인딩 추가
             tree.bind('<ButtonRelease-1>', self.on_tree_item_click)
 
+            # 피벗 탭 추가
+            if self.rollups is None:
+                self.rollups = ChangeRollups(self.df)
+            pivot_tab = ttk.Frame(notebook)
+            notebook.add(pivot_tab, text="피벗")
+            self.build_pivot_tab(pivot_tab)
+
+            # 시점 조회 탭 추가
+            state_tab = ttk.Frame(notebook)
+            notebook.add(state_tab, text="시점 조회")
+            self.build_state_tab(state_tab)
+
         else:
             messagebox.showwarning("경고", "먼저 변경 사항을 추적해주세요.")
 
+    def build_pivot_tab(self, pivot_tab):
+        """캐시된 집계로 피벗 테이블을 보여주는 탭을 구성합니다."""
+        control_frame = ttk.Frame(pivot_tab)
+        control_frame.pack(side='top', fill='x', padx=10, pady=5)
+
+        no_column = '(없음)'
+        ttk.Label(control_frame, text="행:").pack(side='left', padx=5)
+        row_combo = ttk.Combobox(control_frame, values=ROLLUP_DIMENSIONS, state='readonly')
+        row_combo.set('담당자')
+        row_combo.pack(side='left', padx=5)
+
+        ttk.Label(control_frame, text="열:").pack(side='left', padx=5)
+        col_combo = ttk.Combobox(control_frame, values=[no_column] + ROLLUP_DIMENSIONS, state='readonly')
+        col_combo.set('이슈 필드')
+        col_combo.pack(side='left', padx=5)
+
+        pivot_frame = ttk.Frame(pivot_tab)
+        pivot_frame.pack(expand=True, fill='both', padx=10, pady=5)
+
+        pivot_tree = ttk.Treeview(pivot_frame, show='headings')
+        pivot_tree.pack(side='left', expand=True, fill='both')
+        vsb = ttk.Scrollbar(pivot_frame, orient="vertical", command=pivot_tree.yview)
+        vsb.pack(side='right', fill='y')
+        hsb = ttk.Scrollbar(pivot_tab, orient="horizontal", command=pivot_tree.xview)
+        hsb.pack(side='bottom', fill='x')
+        pivot_tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+
+        def refresh_pivot(event=None):
+            row_dim = row_combo.get()
+            col_dim = col_combo.get()
+            if col_dim == no_column or col_dim == row_dim:
+                col_dim = None
+            table = self.rollups.pivot(row_dim, col_dim)
+
+            columns = [row_dim] + [str(c) for c in table.columns]
+            pivot_tree.delete(*pivot_tree.get_children())
+            pivot_tree['columns'] = columns
+            for col in columns:
+                pivot_tree.heading(col, text=col, anchor=tk.W)
+                pivot_tree.column(col, anchor=tk.W, width=150 if col == row_dim else 90, stretch=False)
+            for row in table.itertuples():
+                pivot_tree.insert('', 'end', values=list(row))
+
+        row_combo.bind("<<ComboboxSelected>>", refresh_pivot)
+        col_combo.bind("<<ComboboxSelected>>", refresh_pivot)
+        refresh_pivot()
+
+    def build_state_tab(self, state_tab):
+        """지정한 시점의 이슈 필드 상태(담당자, 상태, 기한 등)를 보여주는 탭을 구성합니다."""
+        control_frame = ttk.Frame(state_tab)
+        control_frame.pack(side='top', fill='x', padx=10, pady=5)
+
+        ttk.Label(control_frame, text="시점:").pack(side='left', padx=5)
+        when_entry = ttk.Entry(control_frame, width=20)
+        when_entry.insert(0, datetime.now(KST).strftime(TIME_FORMAT))
+        when_entry.pack(side='left', padx=5)
+
+        ttk.Label(control_frame, text="이슈 키 (옵션):").pack(side='left', padx=5)
+        key_entry = ttk.Entry(control_frame, width=15)
+        key_entry.pack(side='left', padx=5)
+
+        state_frame = ttk.Frame(state_tab)
+        state_frame.pack(expand=True, fill='both', padx=10, pady=5)
+
+        state_tree = ttk.Treeview(state_frame, show='headings')
+        state_tree.pack(side='left', expand=True, fill='both')
+        vsb = ttk.Scrollbar(state_frame, orient="vertical", command=state_tree.yview)
+        vsb.pack(side='right', fill='y')
+        hsb = ttk.Scrollbar(state_tab, orient="horizontal", command=state_tree.xview)
+        hsb.pack(side='bottom', fill='x')
+
+        def on_state_scroll(first, last):
+            # 결과 표와 같이 스크롤이 끝 부근에 닿으면 다음 페이지를 이어서 삽입
+            vsb.set(first, last)
+            if float(last) >= 0.95 and self.load_more_rows(state_tree):
+                show_row_count()
+
+        state_tree.configure(yscrollcommand=on_state_scroll, xscrollcommand=hsb.set)
+
+        def show_row_count():
+            row_count_label.configure(text=f"{state_tree.loaded_rows:,} / {len(state_tree.pending_rows):,}개 이슈 표시")
+
+        def query_state():
+            try:
+                when = parser.parse(when_entry.get().strip())
+            except (ValueError, OverflowError):
+                messagebox.showerror("입력 오류", "시점을 YYYY-MM-DD HH:MM:SS 형식으로 입력해주세요.")
+                return
+            # 시점 조회 인덱스는 처음 조회할 때 한 번만 만듦
+            if self.timeline is None:
+                self.timeline = FieldTimeline(self.df)
+            table = self.timeline.state_at(when, issue_key=key_entry.get().strip() or None)
+
+            columns = ['# 키'] + [str(c) for c in table.columns]
+            state_tree.delete(*state_tree.get_children())
+            state_tree['columns'] = columns
+            for col in columns:
+                state_tree.heading(col, text=col, anchor=tk.W)
+                state_tree.column(col, anchor=tk.W, width=150, stretch=False)
+            self.update_treeview(state_tree, table.fillna('-').reset_index())
+            state_tree.yview_moveto(0)
+            show_row_count()
+
+        ttk.Button(control_frame, text="조회", command=query_state).pack(side='left', padx=5)
+        row_count_label = ttk.Label(control_frame, text="시점을 입력하고 조회를 눌러주세요.")
+        row_count_label.pack(side='left', padx=5)
+
     def update_treeview(self, tree, data):
         """
         Treeview를 업데이트하는 메서드.
-        기존 항목을 모두 제거하고, 새로운 데이터를 삽입합니다.
+        기존 항목을 모두 제거하고, 새로운 데이터는 첫 페이지(TREEVIEW_PAGE_SIZE행)만 삽입합니다.
+        나머지 행은 load_more_rows로 스크롤할 때 이어서 삽입합니다.
         """
         # 기존 항목 모두 제거
-        for item in tree.get_children():
-            tree.delete(item)
-        
-        # 데이터 삽입 및 색상 코딩
-        for idx, row in data.iterrows():
-            issue_type = row['유형']
-            issue_field = row['이슈 필드']
+        tree.delete(*tree.get_children())
+        tree.pending_rows = data
+        tree.loaded_rows = 0
+        self.load_more_rows(tree)
+
+    def load_more_rows(self, tree, page_size=TREEVIEW_PAGE_SIZE):
+        """아직 삽입하지 않은 행을 page_size만큼 Treeview에 추가합니다. 추가한 행이 없으면 False를 반환합니다."""
+        data = getattr(tree, 'pending_rows', None)
+        if data is None or tree.loaded_rows >= len(data):
+            return False
+        start = tree.loaded_rows
+        data = data.iloc[start:start + page_size]
+        tree.loaded_rows = start + len(data)
+
+        # 데이터 삽입 및 색상 코딩 (유형/이슈 필드 컬럼이 없는 표는 값만 삽입)
+        issue_types = data['유형'] if '유형' in data.columns else [None] * len(data)
+        issue_fields = data['이슈 필드'] if '이슈 필드' in data.columns else [None] * len(data)
+        for values, issue_type, issue_field in zip(data.itertuples(index=False, name=None), issue_types, issue_fields):
             tags = ()
             if issue_type in [
                 '휴지통(최상위일감)', '대분류', '아트 영역 분류'
@@ -400,7 +945,8 @@ class JiraTrackerApp:
             # '삭제된 이슈' 또는 '생성된 이슈'인 경우 'bold' 태그 추가
             if issue_field in ['삭제된 이슈', '생성된 이슈']:
                 tags = tags + ('bold',)
-            tree.insert('', 'end', values=list(row), tags=tags)
+            tree.insert('', 'end', values=list(values), tags=tags)
+        return True
 
     def on_tree_item_click(self, event):
         # 클릭한 영역 확인
@@ -471,30 +1017,7 @@ class JiraTrackerApp:
             file_path = filedialog.asksaveasfilename(defaultextension=".xlsx", filetypes=[("Excel files", "*.xlsx")])
             if file_path:
                 with pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
-                    # '변경 후 내용 URL'은 Excel에 저장하지 않습니다.
-                    export_columns = ['# 키', '유형', '요약', '이슈 필드', '변경 전 내용', '변경 후 내용', '변경 시간', '변경한 사람', '담당자', 'Committer', 'Swarm Link']
-                    export_df = self.df[export_columns]
-                    export_df.to_excel(writer, index=False, sheet_name='변경 사항')
-
-                    workbook = writer.book
-                    worksheet = writer.sheets['변경 사항']
-
-                    # '# 키' 컬럼에 하이퍼링크 설정
-                    for row_num, (issue_key, issue_url) in enumerate(zip(self.df['# 키'], self.df['이슈 URL']), start=1):
-                        if pd.notna(issue_url) and issue_url != '':
-                            worksheet.write_url(row_num, 0, issue_url, string=issue_key)
-
-                    # '변경 후 내용' 컬럼에 하이퍼링크 설정
-                    changed_to_col_index = export_df.columns.get_loc('변경 후 내용')
-                    for row_num, (changed_to, changed_url) in enumerate(zip(self.df['변경 후 내용'], self.df['변경 후 내용 URL']), start=1):
-                        if pd.notna(changed_url) and changed_url != '':
-                            worksheet.write_url(row_num, changed_to_col_index, changed_url, string=str(changed_to))
-
-                    # 삭제된 이슈 및 생성된 이슈 볼드체로 표시
-                    bold_format = workbook.add_format({'bold': True})
-                    for row_num, issue_field in enumerate(self.df['이슈 필드'], start=1):
-                        if issue_field in ['삭제된 이슈', '생성된 이슈']:
-                            worksheet.set_row(row_num, None, bold_format)
+                    write_report_sheet(writer, self.df, '변경 사항')
 
                 messagebox.showinfo("저장 완료", f"결과가 {file_path}에 저장되었습니다.")
         else:
@@ -522,24 +1045,15 @@ def run_jira_tracker(hours, all_issues_flag, assignee_name, author_name, selecte
         raise Exception("JIRA_URL, JIRA_USERNAME, JIRA_API_TOKEN 값을 설정해주세요.")
 
     # 필드 목록 로드
-    fields_to_track_path = resource_path('fields_to_track.json')
-    try:
-        with open(fields_to_track_path, 'r', encoding='utf-8') as f:
-            fields_data = json.load(f)
-            fields_to_track = fields_data['fields_to_track']
-    except FileNotFoundError:
-        raise Exception(f"{fields_to_track_path} 파일을 찾을 수 없습니다. 파일이 있는지 확인해주세요.")
-    except json.JSONDecodeError:
-        raise Exception(f"{fields_to_track_path} 파일의 형식이 잘못되었습니다.")
+    fields_to_track = load_fields_to_track()
 
-    # Jira 연결 설정
-    options = {'server': JIRA_URL}
-    jira_main = JIRA(options, basic_auth=(JIRA_USERNAME, JIRA_API_TOKEN), max_retries=3)
+    # Jira 연결 설정 (Resource 객체 대신 raw JSON을 직접 사용)
+    session_main = create_jira_session(JIRA_USERNAME, JIRA_API_TOKEN)
 
     # 시간 설정 (KST 기준)
-    kst = pytz.timezone('Asia/Seoul')
+    kst = KST
     now_kst = datetime.now(kst)
-    time_format = '%Y-%m-%d %H:%M:%S'
+    time_format = TIME_FORMAT
 
     # 이전 이슈 데이터 로드 (all_issues.json 사용)
     all_issues_path = os.path.join(os.getcwd(), 'all_issues.json')  # 현재 작업 디렉토리에 저장
@@ -551,43 +1065,69 @@ def run_jira_tracker(hours, all_issues_flag, assignee_name, author_name, selecte
 
     # 현재 이슈 목록 수집
     project_keys = ['SART', 'SM7']
-    project_keys_str = ', '.join(f'"{key}"' for key in project_keys)
-
-    # JQL 쿼리 구성
-    jql_parts = [f'project IN ({project_keys_str})']
-
-    if assignee_name:
-        jql_parts.append(f'assignee = "{assignee_name}"')
 
+    # 조회 범위 설정
+    window_start = None
+    window_end = None
     if selected_date:
         # 지정된 날짜부터 현재 시간까지의 범위 설정
-        start_date = datetime.combine(selected_date, datetime.min.time()).astimezone(kst)
-        end_date = now_kst
-        start_date_str = start_date.strftime('%Y/%m/%d %H:%M')
-        end_date_str = end_date.strftime('%Y/%m/%d %H:%M')
-        jql_parts.append(f'updated >= "{start_date_str}" AND updated <= "{end_date_str}"')
+        window_start = datetime.combine(selected_date, datetime.min.time()).astimezone(kst)
+        window_end = now_kst
     else:
         if not all_issues_flag and hours is not None:
             # 조회 범위(시간)를 사용
-            time_ago_kst = now_kst - timedelta(hours=hours)
-            jql_parts.append(f'updated >= "{time_ago_kst.strftime("%Y/%m/%d %H:%M")}"')
+            window_start = now_kst - timedelta(hours=hours)
         elif not all_issues_flag and hours is None:
             # 조회 범위(시간)을 입력하지 않은 경우 오류 발생
             raise ValueError("조회 범위를 입력하거나 지정 날짜를 선택해주세요.")
 
-    jql = ' AND '.join(jql_parts)
+    # Cloud는 변경 이력을 bulk API로 따로 받으므로 검색 결과에 changelog를 포함하지 않음
+    is_cloud = is_cloud_instance(session_main, JIRA_URL)
+
+    # 변경한 사람 필터를 JQL로 내려보내기 위해 표시 이름을 accountId로 변환 (Cloud 전용)
+    author_account_id = None
+    if author_name and is_cloud:
+        author_account_id = resolve_account_id(session_main, JIRA_URL, author_name)
+
+    # JQL 쿼리 구성
+    jql = build_tracker_jql(project_keys, assignee_name, author_name, author_account_id, window_start, window_end)
 
     # 'creator' 필드 추가
-    fields = 'summary,issuetype,created,creator,assignee,comment'  # 'creator' 필드 추가
+    fields = 'summary,issuetype,created,updated,creator,assignee,comment'  # 'creator' 필드 추가
+    expand = None if is_cloud else 'changelog'
 
+    # 전체 이슈 모드: 먼저 프로젝트 전체의 키와 수정 시간만 받아서 살아있는 이슈 목록을 만들고,
+    # 이전 스냅샷 이후 수정된 이슈만 상세 조회
+    live_issues = {}
+    unchanged_issues = {}
     try:
-        issues = jira_main.search_issues(jql, maxResults=False, fields=fields, expand='changelog')
+        if all_issues_flag:
+            live_issues = list_live_issues(session_main, JIRA_URL, build_tracker_jql(project_keys, '', '', None), is_cloud=is_cloud)
+            changed_keys = []
+            for issue_key, updated in live_issues.items():
+                previous = all_issues.get(issue_key)
+                if previous is not None and previous.get('수정 시간') == updated:
+                    unchanged_issues[issue_key] = previous
+                else:
+                    changed_keys.append(issue_key)
+            issues = search_issues_by_keys(session_main, JIRA_URL, jql, changed_keys, fields, expand=expand, is_cloud=is_cloud)
+        else:
+            issues = search_issues_raw(session_main, JIRA_URL, jql, fields, expand=expand, is_cloud=is_cloud)
     except Exception as e:
         raise Exception(f"JIRA 이슈 검색 중 오류가 발생했습니다.\nJQL 쿼리: {jql}\n에러 메시지: {e}")
 
-    current_issue_keys = set()
+    # 변경 이력 일괄 조회 (Cloud 전용, 실패하거나 Server/DC이면 이슈별 조회로 대체)
+    prefetched_histories = {}
+    if is_cloud and issues:
+        try:
+            prefetched_histories = fetch_changelogs_bulk(session_main, JIRA_URL, issues, list(fields_to_track) + ['comment'])
+        except Exception as e:
+            print(f"변경 이력 일괄 조회 중 오류 발생, 이슈별 조회로 대체합니다: {e}")
+            prefetched_histories = {}
+
     changes = []
-    current_issues = {}
+    # 수정되지 않은 이슈는 이전 스냅샷 정보를 그대로 유지
+    current_issues = dict(unchanged_issues)
     issue_queue = Queue()
 
     for issue in issues:
@@ -595,68 +1135,52 @@ def run_jira_tracker(hours, all_issues_flag, assignee_name, author_name, selecte
 
     lock = threading.Lock()
 
-    # 날짜 형식 감지 및 변환 함수 정의
-    def format_if_date(value):
-        if not isinstance(value, str):
-            return value
-        try:
-            dt = parser.parse(value)
-            return dt.strftime(time_format)
-        except (ValueError, TypeError):
-            return value
-
     # RemoteIssueLink를 처리하는 함수 정의 (대체)
     def process_remote_issue_links(issue, changes, now_kst, JIRA_URL, start_date=None, end_date=None):
         """
         댓글에서 링크를 추출하고, 링크의 생성 시간이 지정된 범위 내에 있는 경우에만 추가합니다.
         """
+        fields = issue['fields']
         try:
-            if hasattr(issue.fields, 'comment') and issue.fields.comment:
-                for comment in issue.fields.comment.comments:
-                    comment_body = comment.body
-                    comment_author = comment.author.displayName if hasattr(comment.author, 'displayName') else 'Unknown'
-                    urls = extract_urls_from_comment(comment_body)
-                    committer = extract_committer(comment_body, comment_author)
-                    swarm_link = extract_swarm_link(comment_body)
-
-                    # 변경한 사람 필터링: author_name과 일치하는지 확인
-                    if author_name and committer != author_name:
-                        continue  # 일치하지 않으면 건너뜀
-
-                    # 댓글의 생성 시간이 범위 내에 있는지 확인
-                    comment_created = parser.isoparse(comment.created).astimezone(kst)
-                    if start_date and comment_created < start_date:
-                        continue
-                    if end_date and comment_created > end_date:
-                        continue
+            comments = (fields.get('comment') or {}).get('comments', [])
+            for comment in comments:
+                comment_body = comment.get('body') or ''
+                comment_author = display_name(comment.get('author'))
+                urls = extract_urls_from_comment(comment_body)
+                committer = extract_committer(comment_body, comment_author)
+                swarm_link = extract_swarm_link(comment_body)
+
+                # 변경한 사람 필터링: author_name과 일치하는지 확인
+                if author_name and committer != author_name:
+                    continue  # 일치하지 않으면 건너뜀
+
+                # 댓글의 생성 시간이 범위 내에 있는지 확인
+                comment_created = parser.isoparse(comment['created']).astimezone(kst)
+                if start_date and comment_created < start_date:
+                    continue
+                if end_date and comment_created > end_date:
+                    continue
 
-                    # Assignee 정보 추출
-                    담당자 = issue.fields.assignee.displayName if issue.fields.assignee and hasattr(issue.fields.assignee, 'displayName') else 'Unknown'
-
-                    for url in urls:
-                        changes.append({
-                            '# 키': issue.key,
-                            '유형': issue.fields.issuetype.name if hasattr(issue.fields, 'issuetype') else 'Unknown',
-                            '요약': issue.fields.summary if hasattr(issue.fields, 'summary') else 'Unknown',
-                            '이슈 필드': 'CommentLink',
-                            '변경 전 내용': '',
-                            '변경 후 내용': url,
-                            '변경 시간': comment_created.strftime(time_format),
-                            '변경한 사람': committer,  # Committer 사용
-                            '담당자': 담당자,        # 담당자 추가
-                            '이슈 URL': f"{JIRA_URL}/browse/{issue.key}",
-                            '변경 전 내용 URL': '',
-                            '변경 후 내용 URL': url,
-                            'Committer': committer,
-                            'Swarm Link': swarm_link
-                        })
+                # Assignee 정보 추출
+                담당자 = display_name(fields.get('assignee'))
+
+                for url in urls:
+                    with lock:
+                        changes.append(make_change_row(
+                            issue['key'],
+                            (fields.get('issuetype') or {}).get('name', 'Unknown'),
+                            fields.get('summary', 'Unknown'),
+                            'CommentLink', '', url, comment_created,
+                            committer,  # Committer 사용
+                            담당자, JIRA_URL, '', url, committer, swarm_link
+                        ))
         except Exception as e:
-            print(f"Error processing comment links for issue {issue.key}: {e}")
+            print(f"Error processing comment links for issue {issue['key']}: {e}")
             traceback.print_exc()
 
     # 스레드에서 실행할 함수 정의
     def process_issue():
-        jira = JIRA(options, basic_auth=(JIRA_USERNAME, JIRA_API_TOKEN), max_retries=3)
+        session = create_jira_session(JIRA_USERNAME, JIRA_API_TOKEN)
 
         while True:
             try:
@@ -665,29 +1189,30 @@ def run_jira_tracker(hours, all_issues_flag, assignee_name, author_name, selecte
                 break
 
             try:
-                issue_key = issue.key
-                issue_type = issue.fields.issuetype.name if hasattr(issue.fields, 'issuetype') else 'Unknown'
-                issue_summary = issue.fields.summary if hasattr(issue.fields, 'summary') else 'Unknown'
+                issue_key = issue['key']
+                fields = issue['fields']
+                issue_type = (fields.get('issuetype') or {}).get('name', 'Unknown')
+                issue_summary = fields.get('summary', 'Unknown')
 
                 # Assignee 정보 추출
-                담당자 = issue.fields.assignee.displayName if issue.fields.assignee and hasattr(issue.fields.assignee, 'displayName') else 'Unknown'
+                담당자 = display_name(fields.get('assignee'))
 
                 # 현재 이슈 정보 저장
                 with lock:
-                    current_issue_keys.add(issue_key)
                     current_issues[issue_key] = {
                         '유형': issue_type,
-                        '요약': issue_summary
+                        '요약': issue_summary,
+                        '수정 시간': fields.get('updated')
                     }
 
                 # 이슈 생성 여부 확인
                 try:
-                    created = parser.isoparse(issue.fields.created).astimezone(kst)
+                    created = parser.isoparse(fields['created']).astimezone(kst)
                 except Exception:
                     created = now_kst - timedelta(hours=13)
 
                 # 이슈 생성자 이름 가져오기
-                creator_name = issue.fields.creator.displayName if hasattr(issue.fields, 'creator') and hasattr(issue.fields.creator, 'displayName') else 'Unknown'
+                creator_name = display_name(fields.get('creator'))
 
                 # 이슈 생성 날짜에 대한 필터링 추가
                 include_issue = True
@@ -706,32 +1231,28 @@ def run_jira_tracker(hours, all_issues_flag, assignee_name, author_name, selecte
                     # 변경한 사람 필터링: author_name이 지정되지 않았거나, creator_name이 author_name과 일치할 때만 추가
                     if not author_name or (author_name and creator_name == author_name):
                         with lock:
-                            changes.append({
-                                '# 키': issue_key,
-                                '유형': issue_type,
-                                '요약': issue_summary,
-                                '이슈 필드': '생성된 이슈',
-                                '변경 전 내용': '',
-                                '변경 후 내용': created.strftime(time_format),
-                                '변경 시간': created.strftime(time_format),
-                                '변경한 사람': creator_name,  # creator_name 사용
-                                '담당자': 담당자,              # 담당자 추가
-                                '이슈 URL': f"{JIRA_URL}/browse/{issue_key}",
-                                '변경 전 내용 URL': '',
-                                '변경 후 내용 URL': '',
-                                'Committer': '',
-                                'Swarm Link': ''
-                            })
+                            changes.append(make_change_row(
+                                issue_key, issue_type, issue_summary, '생성된 이슈', '',
+                                created.strftime(time_format), created,
+                                creator_name,  # creator_name 사용
+                                담당자, JIRA_URL
+                            ))
 
                 # 이슈의 변경 이력 가져오기
                 try:
-                    time.sleep(0.05)
-                    issue_detail = jira.issue(issue_key, expand='changelog')
-                    changelog = issue_detail.changelog
-
-                    for history in changelog.histories:
+                    # 일괄 조회한 이력이 있으면 사용하고, 없으면 검색 결과의 changelog를 사용
+                    # 검색 결과의 changelog도 없거나 잘린 경우에만 이슈별로 다시 요청
+                    histories = prefetched_histories.get(issue_key)
+                    if histories is None:
+                        changelog = issue.get('changelog') or {}
+                        histories = changelog.get('histories')
+                        if histories is None or changelog.get('total', len(histories)) > len(histories):
+                            time.sleep(0.05)
+                            histories = get_issue_histories_raw(session, JIRA_URL, issue_key)
+
+                    for history in histories:
                         try:
-                            history_created = parser.isoparse(history.created).astimezone(kst)
+                            history_created = parse_jira_time(history['created'])
                         except Exception:
                             continue
 
@@ -747,19 +1268,20 @@ def run_jira_tracker(hours, all_issues_flag, assignee_name, author_name, selecte
 
                         if include_change:
                             # 변경한 사람 필터링: history.author.displayName이 지정된 author_name과 일치하는지 확인
-                            history_author = history.author.displayName if hasattr(history.author, 'displayName') else 'Unknown'
+                            history_author = display_name(history.get('author'))
                             if author_name and history_author != author_name:
                                 continue  # 일치하지 않으면 건너뜀
 
-                            for item in history.items:
-                                field_identifier = getattr(item, 'fieldId', item.field)
-                                if field_identifier in fields_to_track or item.field.lower() == 'comment':
-                                    from_string = str(item.fromString) if item.fromString else ''
-                                    to_string = str(item.toString) if item.toString else ''
+                            for item in history.get('items', []):
+                                item_field = item.get('field', '')
+                                field_identifier = item.get('fieldId', item_field)
+                                if field_identifier in fields_to_track or item_field.lower() == 'comment':
+                                    from_string = str(item['fromString']) if item.get('fromString') else ''
+                                    to_string = str(item['toString']) if item.get('toString') else ''
                                     author_name_history = history_author
 
                                     # 디버깅 로그 추가
-                                    print(f"Processing field: {item.field}")
+                                    print(f"Processing field: {item_field}")
                                     print(f"From: {from_string}")
                                     print(f"To: {to_string}")
                                     print(f"Author: {author_name_history}")
@@ -774,26 +1296,12 @@ def run_jira_tracker(hours, all_issues_flag, assignee_name, author_name, selecte
                                     # 변경 후 내용에서 URL 추출
                                     to_url = extract_url(to_string)
 
-                                    # Assignee 정보 추출
-                                    담당자 = issue.fields.assignee.displayName if issue.fields.assignee and hasattr(issue.fields.assignee, 'displayName') else 'Unknown'
-
                                     with lock:
-                                        changes.append({
-                                            '# 키': issue_key,
-                                            '유형': issue_type,
-                                            '요약': issue_summary,
-                                            '이슈 필드': item.field,
-                                            '변경 전 내용': from_formatted,
-                                            '변경 후 내용': to_formatted,
-                                            '변경 시간': history_created.strftime(time_format),
-                                            '변경한 사람': author_name_history,
-                                            '담당자': 담당자,          # 담당자 추가
-                                            '이슈 URL': f"{JIRA_URL}/browse/{issue_key}",
-                                            '변경 전 내용 URL': from_url if from_url else '',
-                                            '변경 후 내용 URL': to_url if to_url else '',
-                                            'Committer': '',
-                                            'Swarm Link': ''
-                                        })
+                                        changes.append(make_change_row(
+                                            issue_key, issue_type, issue_summary, item_field,
+                                            from_formatted, to_formatted, history_created,
+                                            author_name_history, 담당자, JIRA_URL, from_url, to_url
+                                        ))
                 except Exception as e:
                     print(f"Error processing issue {issue_key}: {e}")
                     traceback.print_exc()
@@ -836,44 +1344,55 @@ def run_jira_tracker(hours, all_issues_flag, assignee_name, author_name, selecte
     for t in threads:
         t.join()
 
-    # 삭제된 이슈 검출
+    # 수정되었지만 필터(담당자, 변경한 사람, 기간) 때문에 검색되지 않은 이슈도 스냅샷에서 빠지지 않도록
+    # 이전 스냅샷 정보를 그대로 유지 (수정 시간이 이전 값이므로 다음 실행에서 다시 확인됨)
+    for issue_key in live_issues:
+        if issue_key not in current_issues and issue_key in all_issues:
+            current_issues[issue_key] = all_issues[issue_key]
+
+    # 삭제된 이슈 검출 (스냅샷의 키를 살아있는 키 목록과 차례로 비교)
     if all_issues_flag:
-        deleted_issues = set(all_issues.keys()) - set(current_issue_keys)
-        for issue_key in deleted_issues:
+        for issue_key in find_deleted_issue_keys(session_main, JIRA_URL, all_issues, live_issues):
             issue_info = all_issues[issue_key]
-            changes.append({
-                '# 키': issue_key,
-                '유형': issue_info.get('유형', ''),
-                '요약': issue_info.get('요약', ''),
-                '이슈 필드': '삭제된 이슈',
-                '변경 전 내용': 'Exists',
-                '변경 후 내용': 'Deleted',
-                '변경 시간': now_kst.strftime(time_format),
-                '변경한 사람': '',
-                '담당자': '',               # 담당자 추가
-                '이슈 URL': f"{JIRA_URL}/browse/{issue_key}",
-                '변경 전 내용 URL': '',
-                '변경 후 내용 URL': '',
-                'Committer': '',
-                'Swarm Link': ''
-            })
+            changes.append(make_change_row(
+                issue_key, issue_info.get('유형', ''), issue_info.get('요약', ''), '삭제된 이슈',
+                'Exists', 'Deleted', now_kst, '',
+                '',  # 담당자 추가
+                JIRA_URL
+            ))
 
     if all_issues_flag:
         save_all_issues(current_issues, all_issues_path)
 
     # 결과 DataFrame 반환
-    if changes:
-        df = pd.DataFrame(changes)
-        df['변경 시간'] = pd.to_datetime(df['변경 시간'], format=time_format)
+    return changes_to_dataframe(changes)
 
-        def convert_to_datetime(value):
-            if isinstance(value, str):
-                try:
-                    return pd.to_datetime(value, format=time_format)
-                except (ValueError, TypeError):
-                    return value
+def load_fields_to_track():
+    """fields_to_track.json에서 추적할 필드 목록을 읽습니다."""
+    fields_to_track_path = resource_path('fields_to_track.json')
+    try:
+        with open(fields_to_track_path, 'r', encoding='utf-8') as f:
+            fields_data = json.load(f)
+            return fields_data['fields_to_track']
+    except FileNotFoundError:
+        raise Exception(f"{fields_to_track_path} 파일을 찾을 수 없습니다. 파일이 있는지 확인해주세요.")
+    except json.JSONDecodeError:
+        raise Exception(f"{fields_to_track_path} 파일의 형식이 잘못되었습니다.")
+
+# 날짜 형식의 변경 내용을 Timestamp로 변환하는 함수
+def convert_to_datetime(value):
+    if isinstance(value, str):
+        try:
+            return pd.to_datetime(value, format=TIME_FORMAT)
+        except (ValueError, TypeError):
             return value
+    return value
 
+def changes_to_dataframe(changes):
+    """변경 이력 행 목록을 결과 DataFrame으로 변환합니다."""
+    if changes:
+        df = pd.DataFrame(changes)
+        df['변경 시간'] = pd.to_datetime(df['변경 시간'], format=TIME_FORMAT)
         df['변경 전 내용'] = df['변경 전 내용'].apply(convert_to_datetime)
         df['변경 후 내용'] = df['변경 후 내용'].apply(convert_to_datetime)
 
@@ -889,6 +1408,338 @@ def run_jira_tracker(hours, all_issues_flag, assignee_name, author_name, selecte
     else:
         return pd.DataFrame([])
 
+# JIRA REST API 호출 (jira Resource 객체를 만들지 않고 raw JSON을 직접 사용)
+JIRA_SEARCH_PAGE_SIZE = 100
+CHANGELOG_BULK_BATCH_SIZE = 1000  # bulkfetch 한 번에 보낼 수 있는 최대 이슈 수
+CHANGELOG_BULK_FIELD_LIMIT = 10  # bulkfetch 한 번에 보낼 수 있는 최대 fieldIds 수
+KEY_LISTING_PAGE_SIZE = 1000
+KEY_LISTING_THREADS = 5
+KEY_SEARCH_CHUNK_SIZE = 100
+ACCOUNT_ID_CACHE_PATH = os.path.join(os.getcwd(), 'jira_account_ids.json')
+ACCOUNT_ID_CACHE = {}  # 표시 이름 -> accountId
+ACCOUNT_ID_LOCK = threading.Lock()
+
+def json_loads(data):
+    """orjson이 있으면 orjson으로, 없으면 표준 json 모듈로 파싱합니다."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def display_name(user):
+    """사용자 JSON에서 displayName을 꺼냅니다. 없으면 'Unknown'을 반환합니다."""
+    return (user or {}).get('displayName', 'Unknown')
+
+def parse_jira_time(value):
+    """
+    JIRA 시간 값을 KST 기준 datetime으로 변환합니다.
+    ISO 8601 문자열과 bulkfetch 응답의 epoch 숫자(초 또는 밀리초)를 모두 처리합니다.
+    """
+    if isinstance(value, (int, float)):
+        seconds = value / 1000 if value > 1e11 else value
+        return datetime.fromtimestamp(seconds, KST)
+    return parser.isoparse(value).astimezone(KST)
+
+def create_jira_session(username, api_token):
+    """기본 인증이 설정된 requests 세션을 만듭니다. 스레드마다 하나씩 사용합니다."""
+    session = requests.Session()
+    session.auth = (username, api_token)
+    session.headers.update({'Accept': 'application/json'})
+    return session
+
+def thread_session_getter(session):
+    """
+    session과 같은 인증/헤더를 가진 세션을 스레드마다 하나씩 만들어 돌려주는 함수를 반환합니다.
+    requests.Session은 스레드 간 공유가 안전하지 않으므로 스레드 풀 작업에서는 이 함수로 세션을 얻습니다.
+    """
+    local = threading.local()
+
+    def get_session():
+        if getattr(local, 'session', None) is None:
+            local.session = requests.Session()
+            local.session.auth = session.auth
+            local.session.headers.update(session.headers)
+        return local.session
+    return get_session
+
+def jira_request_json(session, method, url, params=None, payload=None, max_retries=3):
+    """
+    JIRA REST API를 호출하고 응답 본문을 JSON으로 파싱해 반환합니다.
+    429(요청 제한)와 5xx 응답은 max_retries번까지 재시도합니다.
+    """
+    for attempt in range(max_retries + 1):
+        response = session.request(method, url, params=params, json=payload)
+        retryable = response.status_code == 429 or response.status_code >= 500
+        if retryable and attempt < max_retries:
+            retry_after = response.headers.get('Retry-After')
+            time.sleep(float(retry_after) if retry_after and retry_after.isdigit() else 2 ** attempt)
+            continue
+        response.raise_for_status()
+        return json_loads(response.content) if response.content else {}
+
+def search_issues_raw(session, jira_url, jql, fields, expand=None, is_cloud=False,
+                      page_size=JIRA_SEARCH_PAGE_SIZE, validate_query=None):
+    """
+    JQL 검색 결과 전체를 페이지 단위로 받아 이슈 JSON(dict) 목록으로 반환합니다.
+    Cloud는 /rest/api/2/search/jql을 nextPageToken으로, Server/DC는 /rest/api/2/search를 startAt으로 넘깁니다.
+    validate_query는 Server/DC /rest/api/2/search의 validateQuery(true/false)로만 전달되며, Cloud search/jql에는 보내지 않습니다.
+    """
+    payload = {
+        'jql': jql,
+        'maxResults': page_size,
+        'fields': fields.split(',') if isinstance(fields, str) else list(fields),
+    }
+    issues = []
+
+    if is_cloud:
+        # Cloud는 기존 /search가 제거되어 search/jql만 사용 가능 (startAt, total 없음)
+        url = f"{jira_url}/rest/api/2/search/jql"
+        if expand:
+            payload['expand'] = expand if isinstance(expand, str) else ','.join(expand)
+        while True:
+            data = jira_request_json(session, 'POST', url, payload=payload)
+            issues.extend(data.get('issues', []))
+            next_page_token = data.get('nextPageToken')
+            if not next_page_token or data.get('isLast'):
+                return issues
+            payload['nextPageToken'] = next_page_token
+
+    url = f"{jira_url}/rest/api/2/search"
+    if expand:
+        payload['expand'] = expand.split(',') if isinstance(expand, str) else list(expand)
+    if validate_query is not None:
+        payload['validateQuery'] = validate_query
+
+    start_at = 0
+    while True:
+        payload['startAt'] = start_at
+        data = jira_request_json(session, 'POST', url, payload=payload)
+        page = data.get('issues', [])
+        issues.extend(page)
+        start_at += len(page)
+        if not page or start_at >= data.get('total', 0):
+            return issues
+
+def is_cloud_instance(session, jira_url):
+    """serverInfo의 deploymentType으로 JIRA Cloud 여부를 확인합니다. 확인할 수 없으면 False입니다."""
+    try:
+        info = jira_request_json(session, 'GET', f"{jira_url}/rest/api/2/serverInfo")
+    except Exception as e:
+        print(f"serverInfo 조회 중 오류 발생: {e}")
+        return False
+    return info.get('deploymentType') == 'Cloud'
+
+def fetch_changelogs_bulk(session, jira_url, issues, field_ids, batch_size=CHANGELOG_BULK_BATCH_SIZE):
+    """
+    Cloud의 POST /rest/api/3/changelog/bulkfetch로 여러 이슈의 변경 이력을 한 번에 가져옵니다.
+    field_ids로 서버 쪽에서 필드를 걸러내며, 결과는 {이슈 키: histories} 형태입니다.
+    fieldIds는 요청당 10개까지이므로 10개씩 나눠 요청하고, 같은 이력(id)에 속한 항목은 하나로 합칩니다.
+    """
+    url = f"{jira_url}/rest/api/3/changelog/bulkfetch"
+    id_to_key = {issue['id']: issue['key'] for issue in issues}
+    issue_ids = list(id_to_key)
+    histories_by_key = {key: {} for key in id_to_key.values()}  # 이슈 키 -> {이력 id: history}
+
+    field_ids = list(dict.fromkeys(field_ids or []))
+    field_groups = [field_ids[j:j + CHANGELOG_BULK_FIELD_LIMIT]
+                    for j in range(0, len(field_ids), CHANGELOG_BULK_FIELD_LIMIT)] or [None]
+
+    for field_group in field_groups:
+        for i in range(0, len(issue_ids), batch_size):
+            payload = {'issueIdsOrKeys': issue_ids[i:i + batch_size], 'maxResults': 1000}
+            if field_group:
+                payload['fieldIds'] = field_group
+
+            # 응답이 여러 페이지로 나뉘면 nextPageToken으로 이어서 요청
+            while True:
+                data = jira_request_json(session, 'POST', url, payload=payload)
+                for issue_changelog in data.get('issueChangeLogs', []):
+                    issue_key = id_to_key.get(str(issue_changelog.get('issueId')))
+                    if issue_key is None:
+                        continue
+                    histories = histories_by_key[issue_key]
+                    for history in issue_changelog.get('changeHistories', []):
+                        history_id = history.get('id') or id(history)
+                        if history_id in histories:
+                            histories[history_id]['items'].extend(history.get('items', []))
+                        else:
+                            histories[history_id] = dict(history, items=list(history.get('items', [])))
+                next_page_token = data.get('nextPageToken')
+                if not next_page_token:
+                    break
+                payload['nextPageToken'] = next_page_token
+
+    return {key: list(histories.values()) for key, histories in histories_by_key.items()}
+
+def list_live_issues(session, jira_url, jql, is_cloud=False, num_threads=KEY_LISTING_THREADS):
+    """
+    JQL에 해당하는 모든 이슈의 {키: 수정 시간}을 가져옵니다.
+    fields=updated만 요청합니다. Server/DC는 첫 페이지로 전체 개수를 확인한 뒤 나머지 페이지를 병렬로 받고,
+    Cloud는 search/jql에 전체 개수와 startAt이 없으므로 nextPageToken으로 차례로 받습니다.
+    """
+    ordered_jql = f'{jql} ORDER BY key ASC'
+    if is_cloud:
+        issues = search_issues_raw(session, jira_url, ordered_jql, ['updated'], is_cloud=True, page_size=KEY_LISTING_PAGE_SIZE)
+        return {issue['key']: (issue.get('fields') or {}).get('updated') for issue in issues}
+
+    url = f"{jira_url}/rest/api/2/search"
+    get_session = thread_session_getter(session)
+
+    def fetch_page(start_at):
+        payload = {
+            'jql': ordered_jql,
+            'startAt': start_at,
+            'maxResults': KEY_LISTING_PAGE_SIZE,
+            'fields': ['updated']
+        }
+        return jira_request_json(get_session(), 'POST', url, payload=payload)
+
+    first_page = fetch_page(0)
+    pages = [first_page]
+    # 서버가 maxResults를 줄여서 응답할 수 있으므로 실제 페이지 크기를 기준으로 나눔
+    page_size = first_page.get('maxResults') or len(first_page.get('issues', []))
+    total = first_page.get('total', 0)
+    if page_size:
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            pages.extend(executor.map(fetch_page, range(page_size, total, page_size)))
+
+    live_issues = {}
+    for page in pages:
+        for issue in page.get('issues', []):
+            live_issues[issue['key']] = (issue.get('fields') or {}).get('updated')
+    return live_issues
+
+def search_issues_by_keys(session, jira_url, jql, issue_keys, fields, expand=None, is_cloud=False, chunk_size=KEY_SEARCH_CHUNK_SIZE):
+    """
+    jql 조건에 issuekey IN (...)을 덧붙여 지정한 이슈들만 상세 조회합니다.
+    키 목록을 받은 뒤 삭제된 이슈가 섞여 있으면 JQL 전체가 거부되므로, Server/DC는 validateQuery=false로 보내고
+    Cloud는 400 응답을 받은 묶음을 반으로 나눠 다시 요청해 없는 키만 건너뜁니다.
+    """
+    def search_chunk(keys):
+        keys_str = ', '.join(jql_quote(key) for key in keys)
+        try:
+            return search_issues_raw(session, jira_url, f'{jql} AND issuekey IN ({keys_str})', fields, expand=expand,
+                                     is_cloud=is_cloud, validate_query=None if is_cloud else False)
+        except requests.HTTPError as e:
+            if not is_cloud or e.response is None or e.response.status_code != 400:
+                raise
+            if len(keys) == 1:
+                print(f"이슈 {keys[0]} 조회 불가, 건너뜁니다: {e}")
+                return []
+            middle = len(keys) // 2
+            return search_chunk(keys[:middle]) + search_chunk(keys[middle:])
+
+    issues = []
+    for i in range(0, len(issue_keys), chunk_size):
+        issues.extend(search_chunk(issue_keys[i:i + chunk_size]))
+    return issues
+
+def find_deleted_issue_keys(session, jira_url, snapshot, live_issues, num_threads=KEY_LISTING_THREADS):
+    """
+    스냅샷에는 있지만 살아있는 키 목록에 없는 이슈 키를 반환합니다.
+    키 목록을 받는 도중 이슈가 삭제되면 페이지가 밀려 누락될 수 있으므로, 후보는 한 번 더 직접 확인합니다.
+    """
+    candidates = [issue_key for issue_key in snapshot if issue_key not in live_issues]
+    get_session = thread_session_getter(session)
+
+    def is_deleted(issue_key):
+        # 404만 삭제로 보고, 권한/네트워크 오류 등은 삭제되지 않은 것으로 둠
+        try:
+            data = jira_request_json(get_session(), 'GET', f"{jira_url}/rest/api/2/issue/{issue_key}", params={'fields': 'none'})
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return True
+            print(f"이슈 {issue_key} 확인 중 오류 발생: {e}")
+            return False
+        except Exception as e:
+            print(f"이슈 {issue_key} 확인 중 오류 발생: {e}")
+            return False
+        # 다른 프로젝트로 이동된 이슈는 새 키로 응답하므로 삭제된 것으로 처리
+        return data.get('key') != issue_key
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        return [issue_key for issue_key, deleted in zip(candidates, executor.map(is_deleted, candidates)) if deleted]
+
+def jql_quote(value):
+    """JQL 문자열 리터럴로 감쌉니다."""
+    return '"' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+def build_tracker_jql(project_keys, assignee_name, author_name, author_account_id, start=None, end=None):
+    """
+    run_tracker의 조건을 서버 쪽 JQL 조건으로 바꿉니다.
+    author_account_id가 있으면 변경한 사람 조건을 updatedBy()로 내려보내 후보 이슈만 받습니다.
+    댓글의 Committer는 JIRA 사용자가 아니므로 comment ~ 조건을 함께 붙입니다.
+    결과는 후보 이슈 목록일 뿐이며, 정확한 필터링은 process_issue에서 그대로 수행합니다.
+    """
+    jql_time_format = '%Y/%m/%d %H:%M'
+    project_keys_str = ', '.join(jql_quote(key) for key in project_keys)
+    jql_parts = [f'project IN ({project_keys_str})']
+
+    if assignee_name:
+        jql_parts.append(f'assignee = {jql_quote(assignee_name)}')
+
+    if start:
+        jql_parts.append(f'updated >= {jql_quote(start.strftime(jql_time_format))}')
+    if end:
+        jql_parts.append(f'updated <= {jql_quote(end.strftime(jql_time_format))}')
+
+    if author_account_id:
+        updated_by_args = [jql_quote(author_account_id)]
+        if start:
+            updated_by_args.append(jql_quote(start.strftime(jql_time_format)))
+            if end:
+                updated_by_args.append(jql_quote(end.strftime(jql_time_format)))
+        jql_parts.append(
+            f'(issuekey IN updatedBy({", ".join(updated_by_args)}) OR comment ~ {jql_quote(jql_quote(author_name))})'
+        )
+
+    return ' AND '.join(jql_parts)
+
+def resolve_account_id(session, jira_url, name):
+    """
+    표시 이름을 accountId로 변환합니다. 결과는 메모리와 jira_account_ids.json에 캐시합니다.
+    표시 이름이 정확히 일치하는 사용자가 없으면 None을 반환합니다.
+    """
+    with ACCOUNT_ID_LOCK:
+        if not ACCOUNT_ID_CACHE:
+            ACCOUNT_ID_CACHE.update(load_account_ids(ACCOUNT_ID_CACHE_PATH))
+        if name in ACCOUNT_ID_CACHE:
+            return ACCOUNT_ID_CACHE[name]
+
+    try:
+        users = jira_request_json(session, 'GET', f"{jira_url}/rest/api/3/user/search", params={'query': name})
+    except Exception as e:
+        print(f"사용자 검색 중 오류 발생: {e}")
+        return None
+
+    account_id = next((user['accountId'] for user in users if user.get('displayName') == name), None)
+    if account_id is None:
+        return None
+
+    with ACCOUNT_ID_LOCK:
+        ACCOUNT_ID_CACHE[name] = account_id
+        save_account_ids(ACCOUNT_ID_CACHE, ACCOUNT_ID_CACHE_PATH)
+    return account_id
+
+def load_account_ids(file_path):
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_account_ids(data, file_path):
+    try:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=4)
+    except Exception as e:
+        print(f"jira_account_ids.json 저장 중 오류 발생: {e}")
+
+def get_issue_histories_raw(session, jira_url, issue_key):
+    """이슈 하나의 전체 변경 이력(histories)을 JSON으로 가져옵니다."""
+    url = f"{jira_url}/rest/api/2/issue/{issue_key}"
+    data = jira_request_json(session, 'GET', url, params={'expand': 'changelog', 'fields': 'none'})
+    return (data.get('changelog') or {}).get('histories', [])
+
 def load_all_issues(file_path):
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
@@ -906,7 +1757,834 @@ def save_all_issues(data, file_path):
     except Exception as e:
         print(f"all_issues.json 저장 중 오류 발생: {e}")
 
+# 3. 변경 이력 집계 (롤업)
+ROLLUP_DIMENSIONS = ['담당자', '변경한 사람', '이슈 필드', '유형', '날짜']
+
+class ChangeRollups:
+    """
+    변경 이력 DataFrame의 그룹별 건수(담당자, 변경한 사람, 이슈 필드, 유형, 날짜)를 미리 계산해 보관합니다.
+    단일 차원과 두 차원 조합의 건수를 모두 캐시하며, 새 행이 들어오면 update()로 증분 갱신합니다.
+    """
+    def __init__(self, df=None):
+        self.lock = threading.Lock()
+        self.counts = {}  # (차원, ...) -> 건수 Series
+        self.pivots = {}  # (행 차원, 열 차원) -> 피벗 DataFrame
+        self.combinations = [(dim,) for dim in ROLLUP_DIMENSIONS]
+        self.combinations += [
+            (ROLLUP_DIMENSIONS[i], ROLLUP_DIMENSIONS[j])
+            for i in range(len(ROLLUP_DIMENSIONS))
+            for j in range(i + 1, len(ROLLUP_DIMENSIONS))
+        ]
+        if df is not None and not df.empty:
+            self.update(df)
+
+    @staticmethod
+    def group_keys(df):
+        """집계 차원 컬럼만 뽑아 결측값을 '-'로 채운 DataFrame을 만듭니다."""
+        keys = pd.DataFrame(index=df.index)
+        for dim in ROLLUP_DIMENSIONS:
+            if dim == '날짜':
+                keys[dim] = pd.to_datetime(df['변경 시간'], errors='coerce').dt.strftime('%Y-%m-%d')
+            elif dim in df.columns:
+                keys[dim] = df[dim].astype(object)
+            else:
+                keys[dim] = None
+        return keys.fillna('-')
+
+    def update(self, new_rows):
+        """새로 들어온 행만 집계해서 기존 건수에 더합니다."""
+        if new_rows is None or new_rows.empty:
+            return
+        keys = self.group_keys(new_rows)
+        partial = {dims: keys.groupby(list(dims), sort=False).size() for dims in self.combinations}
+        with self.lock:
+            for dims, counts in partial.items():
+                previous = self.counts.get(dims)
+                if previous is None:
+                    self.counts[dims] = counts
+                else:
+                    self.counts[dims] = previous.add(counts, fill_value=0).astype('int64')
+            # 피벗은 건수가 바뀌면 다시 만들어야 하므로 비움
+            self.pivots.clear()
+
+    def pivot(self, row_dim, col_dim=None):
+        """
+        row_dim(과 col_dim) 기준 건수 테이블을 반환합니다.
+        col_dim이 없으면 '건수' 한 컬럼, 있으면 교차표에 '합계' 컬럼을 붙여 반환합니다.
+        """
+        with self.lock:
+            cached = self.pivots.get((row_dim, col_dim))
+            if cached is not None:
+                return cached
+
+            if col_dim is None:
+                counts = self.counts.get((row_dim,))
+                if counts is None:
+                    return pd.DataFrame(columns=['건수'])
+                table = counts.sort_values(ascending=False).to_frame('건수')
+            else:
+                dims = tuple(dim for dim in ROLLUP_DIMENSIONS if dim in (row_dim, col_dim))
+                counts = self.counts.get(dims)
+                if counts is None:
+                    return pd.DataFrame(columns=['합계'])
+                table = counts.unstack(col_dim, fill_value=0)
+                table = table.reindex(sorted(table.columns, key=str), axis=1)
+                table['합계'] = table.sum(axis=1)
+                table = table.sort_values('합계', ascending=False)
+
+            self.pivots[(row_dim, col_dim)] = table
+            return table
+
+# 4. JIRA 웹훅 수신
+# 기본은 이 PC에서만 접속 가능. 외부 JIRA에서 받으려면 WEBHOOK_HOST와 WEBHOOK_SECRET을 함께 설정
+WEBHOOK_HOST = '127.0.0.1'
+WEBHOOK_PORT = 8765
+
+def verify_webhook_signature(secret, body, signature_header):
+    """JIRA 웹훅의 X-Hub-Signature(sha256=HMAC) 헤더가 secret으로 서명된 것인지 확인합니다."""
+    if not signature_header or not signature_header.startswith('sha256='):
+        return False
+    expected = hmac.new(secret.encode('utf-8'), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature_header[len('sha256='):])
+
+def webhook_payload_to_changes(payload, jira_url, fields_to_track):
+    """
+    JIRA 웹훅 payload를 process_issue와 같은 형식의 변경 이력 행 목록으로 변환합니다.
+    jira:issue_updated, jira:issue_created, jira:issue_deleted, comment_created 이벤트를 처리합니다.
+    """
+    event = (payload.get('webhookEvent') or '').split(':')[-1]
+    issue = payload.get('issue') or {}
+    issue_key = issue.get('key')
+    if not issue_key:
+        return []
+
+    fields = issue.get('fields') or {}
+    issue_type = (fields.get('issuetype') or {}).get('name', 'Unknown')
+    issue_summary = fields.get('summary', 'Unknown')
+    담당자 = (fields.get('assignee') or {}).get('displayName', 'Unknown')
+    user_name = (payload.get('user') or {}).get('displayName', 'Unknown')
+
+    timestamp = payload.get('timestamp')
+    if timestamp:
+        event_time = datetime.fromtimestamp(timestamp / 1000, KST)
+    else:
+        event_time = datetime.now(KST)
+
+    changes = []
+    if event == 'issue_created':
+        try:
+            created = parser.isoparse(fields['created']).astimezone(KST)
+        except Exception:
+            created = event_time
+        creator_name = (fields.get('creator') or {}).get('displayName', user_name)
+        changes.append(make_change_row(issue_key, issue_type, issue_summary, '생성된 이슈', '',
+                                       created.strftime(TIME_FORMAT), created, creator_name, 담당자, jira_url))
+
+    elif event == 'issue_deleted':
+        changes.append(make_change_row(issue_key, issue_type, issue_summary, '삭제된 이슈', 'Exists', 'Deleted',
+                                       event_time, user_name, 담당자, jira_url))
+
+    elif event == 'issue_updated':
+        for item in (payload.get('changelog') or {}).get('items', []):
+            field = item.get('field', '')
+            field_identifier = item.get('fieldId', field)
+            if field_identifier in fields_to_track or field.lower() == 'comment':
+                from_string = str(item['fromString']) if item.get('fromString') else ''
+                to_string = str(item['toString']) if item.get('toString') else ''
+                changes.append(make_change_row(issue_key, issue_type, issue_summary, field,
+                                               format_if_date(from_string), format_if_date(to_string),
+                                               event_time, user_name, 담당자, jira_url,
+                                               extract_url(from_string), extract_url(to_string)))
+
+    elif event == 'comment_created':
+        comment = payload.get('comment') or {}
+        comment_body = comment.get('body') or ''
+        comment_author = (comment.get('author') or {}).get('displayName', 'Unknown')
+        committer = extract_committer(comment_body, comment_author)
+        swarm_link = extract_swarm_link(comment_body)
+        try:
+            comment_created = parser.isoparse(comment['created']).astimezone(KST)
+        except Exception:
+            comment_created = event_time
+        for url in extract_urls_from_comment(comment_body):
+            changes.append(make_change_row(issue_key, issue_type, issue_summary, 'CommentLink', '', url,
+                                           comment_created, committer, 담당자, jira_url, '', url,
+                                           committer, swarm_link))
+
+    return changes
+
+class JiraWebhookHandler(BaseHTTPRequestHandler):
+    """웹훅 POST 요청을 받아 JiraWebhookListener로 넘깁니다."""
+    def do_POST(self):
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            body = self.rfile.read(length)
+        except ValueError:
+            self.send_response(400)
+            self.end_headers()
+            return
+
+        # 비밀 값이 설정된 경우 서명이 맞지 않는 요청은 거부
+        secret = self.server.listener.secret
+        if secret and not verify_webhook_signature(secret, body, self.headers.get('X-Hub-Signature')):
+            self.send_response(401)
+            self.end_headers()
+            return
+
+        try:
+            payload = json.loads(body.decode('utf-8'))
+        except (ValueError, UnicodeDecodeError):
+            payload = None
+        if not isinstance(payload, dict):
+            self.send_response(400)
+            self.end_headers()
+            return
+
+        try:
+            accepted = self.server.listener.handle_payload(payload)
+        except Exception as e:
+            print(f"웹훅 처리 중 오류 발생: {e}")
+            traceback.print_exc()
+            self.send_response(500)
+            self.end_headers()
+            return
+
+        body = json.dumps({'accepted': accepted}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        print(f"[webhook] {self.address_string()} {format % args}")
+
+class JiraWebhookListener:
+    """
+    JIRA 웹훅을 받는 로컬 HTTP 서버입니다.
+    변환된 변경 이력 행 목록을 on_changes 콜백으로 전달하며, port=0이면 빈 포트를 자동으로 사용합니다.
+    secret이 있으면 X-Hub-Signature 서명이 맞는 요청만 받습니다.
+    """
+    def __init__(self, on_changes, jira_url, fields_to_track, host=WEBHOOK_HOST, port=WEBHOOK_PORT, secret=None):
+        self.on_changes = on_changes
+        self.jira_url = jira_url
+        self.fields_to_track = fields_to_track
+        self.secret = secret
+        self.server = ThreadingHTTPServer((host, port), JiraWebhookHandler)
+        self.server.daemon_threads = True
+        self.server.listener = self
+        self.thread = None
+
+    @property
+    def address(self):
+        return self.server.server_address[:2]
+
+    def handle_payload(self, payload):
+        changes = webhook_payload_to_changes(payload, self.jira_url, self.fields_to_track)
+        if changes:
+            self.on_changes(changes)
+        return len(changes)
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+# 5. 시점별 이슈 상태 조회
+# 필드 값 변경이 아닌 행은 인덱스에서 제외
+NON_FIELD_CHANGES = ['생성된 이슈', '삭제된 이슈', 'CommentLink']
+
+class FieldTimeline:
+    """
+    변경 이력을 (이슈 키, 필드, 변경 시간) 순으로 한 번 정렬해 (변경 시간, 변경 전, 변경 후) 배열로 두고,
+    (이슈 키, 필드) 묶음마다 배열 안의 시작/끝 위치만 기록합니다.
+    결과 범위 안의 시점에 대해 정확하며, 첫 변경 이전 시점은 첫 변경의 '변경 전 내용'으로 답합니다.
+    """
+    def __init__(self, df):
+        self.times = np.array([], dtype='datetime64[ns]')
+        self.before = self.after = np.array([], dtype=object)
+        self.starts = self.ends = np.array([], dtype=np.int64)  # 묶음별 배열 구간 [시작, 끝)
+        self.group_keys = self.group_fields = np.array([], dtype=object)
+        self.groups = {}  # (이슈 키, 필드) -> 묶음 번호
+        if df is None or df.empty:
+            return
+        rows = df[~df['이슈 필드'].isin(NON_FIELD_CHANGES)].sort_values(['# 키', '이슈 필드', '변경 시간'], kind='stable')
+        if rows.empty:
+            return
+        keys = rows['# 키'].to_numpy(dtype=object)
+        fields = rows['이슈 필드'].to_numpy(dtype=object)
+        self.times = rows['변경 시간'].to_numpy()
+        self.before = rows['변경 전 내용'].to_numpy(dtype=object)
+        self.after = rows['변경 후 내용'].to_numpy(dtype=object)
+
+        # 이슈 키나 필드가 바뀌는 위치가 묶음의 시작
+        boundary = np.ones(len(rows), dtype=bool)
+        boundary[1:] = (keys[1:] != keys[:-1]) | (fields[1:] != fields[:-1])
+        self.starts = np.flatnonzero(boundary)
+        self.ends = np.append(self.starts[1:], len(rows))
+        self.group_keys = keys[self.starts]
+        self.group_fields = fields[self.starts]
+        self.groups = dict(zip(zip(self.group_keys, self.group_fields), range(len(self.starts))))
+
+    @staticmethod
+    def to_datetime64(when):
+        """시점을 결과 DataFrame과 같은 KST 기준 naive datetime64로 변환합니다."""
+        when = pd.Timestamp(when)
+        if when.tzinfo is not None:
+            when = when.tz_convert(KST).tz_localize(None)
+        return when.to_datetime64()
+
+    def value_at(self, issue_key, field, when):
+        """issue_key 이슈의 field 값이 when 시점에 무엇이었는지 반환합니다. 이력이 없으면 None입니다."""
+        group = self.groups.get((issue_key, field))
+        if group is None:
+            return None
+        start, end = self.starts[group], self.ends[group]
+        pos = np.searchsorted(self.times[start:end], self.to_datetime64(when), side='right')
+        return self.before[start] if pos == 0 else self.after[start + pos - 1]
+
+    def state_at(self, when, fields=None, issue_key=None):
+        """
+        when 시점의 이슈별 필드 값을 '# 키' 인덱스의 DataFrame으로 반환합니다.
+        fields로 필드를, issue_key로 이슈를 제한할 수 있습니다.
+        """
+        when = self.to_datetime64(when)
+        selected = np.ones(len(self.starts), dtype=bool)
+        if issue_key:
+            selected &= self.group_keys == issue_key
+        if fields:
+            selected &= np.isin(self.group_fields, list(fields))
+        starts = self.starts[selected]
+        if len(starts) == 0:
+            return pd.DataFrame(index=pd.Index([], name='# 키'))
+
+        # 묶음 안의 변경은 시간순이므로, when 이전 변경 수로 마지막 변경 위치를 구함
+        counts = np.add.reduceat((self.times <= when).astype(np.int64), self.starts)[selected]
+        last = np.maximum(starts + counts - 1, starts)
+        values = np.where(counts > 0, self.after[last], self.before[starts])
+
+        table = pd.Series(values, index=pd.MultiIndex.from_arrays(
+            [self.group_keys[selected], self.group_fields[selected]], names=['# 키', None])).unstack()
+        return table.reindex(sorted(table.columns, key=str), axis=1)
+
+def query_state_at(df, when, fields=None, issue_key=None):
+    """GUI 없이 결과 DataFrame에서 when 시점의 이슈 상태를 조회합니다."""
+    return FieldTimeline(df).state_at(when, fields, issue_key)
+
+# 리포트 저장
+EXPORT_COLUMNS = ['# 키', '유형', '요약', '이슈 필드', '변경 전 내용', '변경 후 내용', '변경 시간', '변경한 사람', '담당자', 'Committer', 'Swarm Link']
+REPORT_WRITER_THREADS = 4
+
+def write_report_sheet(writer, df, sheet_name):
+    """결과 DataFrame을 하이퍼링크와 볼드체 서식을 포함해 엑셀 시트 하나로 저장합니다."""
+    # '변경 후 내용 URL'은 Excel에 저장하지 않습니다.
+    export_df = df[EXPORT_COLUMNS]
+    export_df.to_excel(writer, index=False, sheet_name=sheet_name)
+
+    workbook = writer.book
+    worksheet = writer.sheets[sheet_name]
+
+    # '# 키' 컬럼에 하이퍼링크 설정
+    for row_num, (issue_key, issue_url) in enumerate(zip(df['# 키'], df['이슈 URL']), start=1):
+        if pd.notna(issue_url) and issue_url != '':
+            worksheet.write_url(row_num, 0, issue_url, string=issue_key)
+
+    # '변경 후 내용' 컬럼에 하이퍼링크 설정
+    changed_to_col_index = export_df.columns.get_loc('변경 후 내용')
+    for row_num, (changed_to, changed_url) in enumerate(zip(df['변경 후 내용'], df['변경 후 내용 URL']), start=1):
+        if pd.notna(changed_url) and changed_url != '':
+            worksheet.write_url(row_num, changed_to_col_index, changed_url, string=str(changed_to))
+
+    # 삭제된 이슈 및 생성된 이슈 볼드체로 표시
+    bold_format = workbook.add_format({'bold': True})
+    for row_num, issue_field in enumerate(df['이슈 필드'], start=1):
+        if issue_field in ['삭제된 이슈', '생성된 이슈']:
+            worksheet.set_row(row_num, None, bold_format)
+
+def split_names(text):
+    """쉼표로 구분된 이름 목록을 나눕니다."""
+    return [name.strip() for name in text.split(',') if name.strip()]
+
+def load_team_file(file_path):
+    """
+    팀 파일에서 (담당자 목록, 변경한 사람 목록)을 읽습니다.
+    JSON은 {"assignees": [...], "authors": [...]} 형식이고, 텍스트 파일은 한 줄에 한 명씩 적으면 두 목록 모두에 사용합니다.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        if file_path.lower().endswith('.json'):
+            team = json.load(f)
+            return list(team.get('assignees', [])), list(team.get('authors', []))
+        names = [line.strip() for line in f if line.strip()]
+        return names, list(names)
+
+def split_reports(df, assignees, authors):
+    """
+    한 번 수집한 결과를 사람별 리포트로 나눕니다.
+    groupby로 담당자/변경한 사람별 행 위치를 한 번에 구한 뒤 이름마다 잘라내며, 결과는 {리포트 이름: DataFrame}입니다.
+    """
+    reports = {}
+    for column, names in (('담당자', assignees), ('변경한 사람', authors)):
+        if not names:
+            continue
+        positions = df.groupby(column, sort=False).indices
+        for name in names:
+            rows = positions.get(name, [])
+            reports[f"{name}_{column.replace(' ', '')}"] = df.iloc[rows]
+    return reports
+
+def safe_report_name(name, max_length=None):
+    """파일 이름이나 시트 이름에 쓸 수 없는 문자를 '_'로 바꿉니다."""
+    name = re.sub(r'[\[\]:*?/\\<>|"]', '_', name).strip() or 'report'
+    return name[:max_length] if max_length else name
+
+def unique_report_name(name, used_names, max_length=None):
+    """
+    safe_report_name으로 바꾼 이름이 used_names와 대소문자 구분 없이 겹치면 _2, _3 ... 을 붙입니다.
+    반환한 이름은 used_names에 추가됩니다.
+    """
+    unique_name = safe_report_name(name, max_length)
+    suffix = 1
+    while unique_name.lower() in used_names:
+        suffix += 1
+        unique_name = f"{safe_report_name(name, max_length - len(str(suffix)) - 1 if max_length else None)}_{suffix}"
+    used_names.add(unique_name.lower())
+    return unique_name
+
+def write_reports(reports, output_path, single_workbook):
+    """
+    사람별 리포트를 저장합니다.
+    single_workbook이면 output_path 통합 문서 하나에 시트로, 아니면 output_path 폴더에 파일별로 병렬 저장합니다.
+    """
+    used_names = set()
+    if single_workbook:
+        with pd.ExcelWriter(output_path, engine='xlsxwriter') as writer:
+            for report_name, report_df in reports.items():
+                # 엑셀 시트 이름은 31자까지이며 대소문자 구분 없이 중복될 수 없음
+                write_report_sheet(writer, report_df, unique_report_name(report_name, used_names, 31))
+        return
+
+    os.makedirs(output_path, exist_ok=True)
+    # 'a/b'와 'a_b'처럼 같은 파일 이름이 되는 경우 서로 덮어쓰지 않도록 (Windows는 대소문자 구분 없음)
+    file_items = [(unique_report_name(report_name, used_names), report_df) for report_name, report_df in reports.items()]
+
+    def write_file(item):
+        file_name, report_df = item
+        file_path = os.path.join(output_path, f"{file_name}.xlsx")
+        with pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
+            write_report_sheet(writer, report_df, '변경 사항')
+
+    with ThreadPoolExecutor(max_workers=REPORT_WRITER_THREADS) as executor:
+        list(executor.map(write_file, file_items))
+
+# 6. 최근 실행 결과 저장 (웜 스타트)
+RECENT_RUNS_DIR = os.path.join(os.getcwd(), 'recent_runs')
+RECENT_RUNS_LIMIT = 5
+
+def load_recent_runs_index():
+    """최근 실행 목록(최신순)을 읽습니다."""
+    try:
+        with open(os.path.join(RECENT_RUNS_DIR, 'index.json'), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+
+def save_recent_run(df, params):
+    """
+    결과 DataFrame을 실행 조건과 함께 저장하고, 최근 RECENT_RUNS_LIMIT개만 남깁니다.
+    pyarrow가 있으면 메모리 매핑으로 바로 열 수 있도록 압축하지 않은 Feather로, 없으면 pickle로 저장합니다.
+    """
+    try:
+        os.makedirs(RECENT_RUNS_DIR, exist_ok=True)
+        saved_at = datetime.now(KST)
+        file_name = saved_at.strftime('run_%Y%m%d_%H%M%S') + ('.feather' if feather is not None else '.pkl')
+        file_path = os.path.join(RECENT_RUNS_DIR, file_name)
+        if feather is not None:
+            # Arrow는 한 컬럼에 날짜와 문자열이 섞이는 것을 허용하지 않으므로 그런 컬럼은 문자열로 저장
+            feather.write_feather(arrow_compatible(df), file_path, compression='uncompressed')
+        else:
+            df.to_pickle(file_path)
+
+        recent_runs = [{
+            'file': file_name,
+            'params': params,
+            'rows': len(df),
+            'saved_at': saved_at.strftime(TIME_FORMAT)
+        }] + load_recent_runs_index()
+        for old_run in recent_runs[RECENT_RUNS_LIMIT:]:
+            try:
+                os.remove(os.path.join(RECENT_RUNS_DIR, old_run['file']))
+            except OSError:
+                pass
+
+        index_path = os.path.join(RECENT_RUNS_DIR, 'index.json')
+        temp_filename = index_path + '.temp'
+        with open(temp_filename, 'w', encoding='utf-8') as f:
+            json.dump(recent_runs[:RECENT_RUNS_LIMIT], f, ensure_ascii=False, indent=4)
+        shutil.move(temp_filename, index_path)
+    except Exception as e:
+        print(f"최근 실행 결과 저장 중 오류 발생: {e}")
+
+def load_recent_run(run):
+    """
+    최근 실행 목록의 항목 하나를 DataFrame으로 불러옵니다. Feather 파일은 메모리 매핑으로 엽니다.
+    arrow_compatible이 문자열로 저장한 변경 전/후 내용의 날짜는 changes_to_dataframe과 같이 다시 Timestamp로 바꿉니다.
+    """
+    file_path = os.path.join(RECENT_RUNS_DIR, run['file'])
+    if not file_path.endswith('.feather'):
+        return pd.read_pickle(file_path)
+    if feather is None:
+        raise Exception("Feather 파일을 열려면 pyarrow가 필요합니다.")
+    df = feather.read_table(file_path, memory_map=True).to_pandas()
+    for col in ['변경 전 내용', '변경 후 내용']:
+        if col in df.columns:
+            df[col] = df[col].astype(object).apply(convert_to_datetime)
+    return df
+
+def arrow_compatible(df):
+    """문자열이 아닌 값이 섞인 object 컬럼을 문자열(결측값은 None) 컬럼으로 바꾼 사본을 반환합니다."""
+    out = df.copy()
+    for col in out.columns:
+        if out[col].dtype == object and not out[col].map(lambda v: isinstance(v, str)).all():
+            out[col] = out[col].map(lambda v: value_to_text(v, missing=None))
+    return out.reset_index(drop=True)
+
+# 7. 팀 공유 캐시 서버
+# 기본은 이 PC에서만 접속 가능. 팀에 공유하려면 --host와 TRACKER_SERVER_TOKEN을 함께 설정
+TRACKER_SERVER_HOST = '127.0.0.1'
+TRACKER_SERVER_PORT = 8766
+TRACKER_TOKEN_HEADER = 'X-Tracker-Token'
+TRACKER_CRAWL_INTERVAL_MINUTES = 5
+TRACKER_RETENTION_HOURS = 24 * 7
+CHANGE_ROW_IDENTITY = ['# 키', '이슈 필드', '변경 시간', '변경한 사람', '변경 전 내용', '변경 후 내용']
+
+def dataframe_to_rows(df):
+    """결과 DataFrame을 JSON으로 보낼 수 있는 행 목록으로 변환합니다. changes_to_dataframe의 역변환입니다."""
+    if df is None or df.empty:
+        return []
+
+    # 날짜 컬럼과 문자열 컬럼은 컬럼 단위로 변환하고, 날짜와 문자열이 섞인 컬럼(변경 전/후 내용)만 값마다 변환
+    columns = []
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            series = series.dt.strftime(TIME_FORMAT).fillna('')
+        elif pd.api.types.infer_dtype(series, skipna=True) in ('string', 'empty'):
+            series = series.fillna('').astype(str)
+        else:
+            series = series.map(value_to_text)
+        columns.append(series.to_numpy(dtype=object))
+    # to_dict('records')보다 컬럼 배열을 묶어 dict를 만드는 쪽이 훨씬 빠름
+    names = [str(col) for col in df.columns]
+    return [dict(zip(names, values)) for values in zip(*columns)]
+
+def query_window_start(hours, selected_date, now_kst):
+    """조회 범위(시간) 또는 지정 날짜로 조회 시작 시각(KST)을 계산합니다."""
+    if selected_date:
+        return datetime.combine(selected_date, datetime.min.time()).astimezone(KST)
+    if hours is None:
+        raise ValueError("조회 범위를 입력하거나 지정 날짜를 선택해주세요.")
+    return now_kst - timedelta(hours=hours)
+
+class ChangeStore:
+    """
+    캐시 서버가 보관하는 변경 이력 저장소입니다.
+    크롤러와 웹훅이 merge()로 행을 넣고, 조회는 DataFrame 마스크로 처리합니다.
+    covered_from~covered_until 구간의 변경 이력은 모두 보관되어 있으며, 수집이 수집 간격의 2배 넘게 끊기면
+    보관된 행이 최신이 아니므로 is_stale()이 True가 됩니다.
+    """
+    def __init__(self, retention_hours=TRACKER_RETENTION_HOURS, crawl_interval_minutes=TRACKER_CRAWL_INTERVAL_MINUTES):
+        self.lock = threading.Lock()
+        self.retention_hours = retention_hours
+        self.stale_after = timedelta(minutes=2 * crawl_interval_minutes)
+        self.df = pd.DataFrame([])
+        self.covered_from = None  # 이 시각 이후의 변경 이력은 모두 보관되어 있음
+        self.covered_until = None  # 마지막으로 성공한 수집이 다룬 구간의 끝
+        self.last_crawl = None
+        self.timeline = None  # 시점 조회용 인덱스 (merge 때마다 다시 만듦)
+
+    def merge(self, new_df, covered_from=None, covered_until=None):
+        """
+        새 행을 합치고 중복과 보관 기간이 지난 행을 제거합니다.
+        크롤러는 수집한 구간을 covered_from, covered_until로 함께 넘기고, 웹훅은 행만 넘깁니다.
+        """
+        now_kst = datetime.now(KST)
+        with self.lock:
+            if new_df is not None and not new_df.empty:
+                merged = new_df if self.df.empty else pd.concat([self.df, new_df], ignore_index=True)
+                identity = merged[CHANGE_ROW_IDENTITY].astype(str)
+                merged = merged[~identity.duplicated(keep='last')]
+                # 담당자는 행을 수집한 시점의 값이므로, 새로 수집된 이슈는 보관 중인 모든 행을 최신 담당자로 갱신
+                latest_assignee = new_df.drop_duplicates('# 키', keep='last').set_index('# 키')['담당자']
+                restamp = merged['# 키'].isin(latest_assignee.index)
+                merged.loc[restamp, '담당자'] = merged.loc[restamp, '# 키'].map(latest_assignee).to_numpy()
+                cutoff = (now_kst - timedelta(hours=self.retention_hours)).replace(tzinfo=None)
+                self.df = merged[merged['변경 시간'] >= cutoff].reset_index(drop=True)
+                self.timeline = None
+            if covered_from is not None:
+                retention_start = now_kst - timedelta(hours=self.retention_hours)
+                if self.covered_from is None or covered_from < self.covered_from:
+                    self.covered_from = covered_from
+                self.covered_from = max(self.covered_from, retention_start)
+                self.covered_until = covered_until or now_kst
+                self.last_crawl = now_kst
+
+    def is_stale(self):
+        """마지막으로 성공한 수집이 수집 간격의 2배보다 오래되었으면 True입니다."""
+        with self.lock:
+            return self.covered_until is None or datetime.now(KST) - self.covered_until > self.stale_after
+
+    def query(self, hours, selected_date, assignee_name, author_name):
+        """
+        run_jira_tracker와 같은 조건으로 보관된 행을 걸러 반환합니다.
+        조회 시작 시각이 보관 범위보다 이르면 None을 반환합니다.
+        """
+        now_kst = datetime.now(KST)
+        start = query_window_start(hours, selected_date, now_kst)
+        with self.lock:
+            if self.covered_from is None or start < self.covered_from:
+                return None
+            df = self.df
+        if df.empty:
+            return df
+
+        mask = df['변경 시간'] >= start.replace(tzinfo=None)
+        if assignee_name:
+            mask &= df['담당자'] == assignee_name
+        if author_name:
+            mask &= df['변경한 사람'] == author_name
+        return df[mask]
+
+    def state_at(self, when, fields=None, issue_key=None):
+        """
+        보관된 변경 이력으로 when 시점의 이슈 상태를 조회합니다.
+        인덱스는 잠금 밖에서 만들고, 그 사이 merge가 없었을 때만 교체해 merge와 다른 조회를 막지 않습니다.
+        """
+        with self.lock:
+            df = self.df
+            timeline = self.timeline
+        if timeline is None:
+            timeline = FieldTimeline(df)
+            with self.lock:
+                if self.df is df:
+                    self.timeline = timeline
+        return timeline.state_at(when, fields, issue_key)
+
+    def status(self):
+        with self.lock:
+            return {
+                'total_rows': len(self.df),
+                'covered_from': self.covered_from.strftime(TIME_FORMAT) if self.covered_from else None,
+                'covered_until': self.covered_until.strftime(TIME_FORMAT) if self.covered_until else None,
+                'last_crawl': self.last_crawl.strftime(TIME_FORMAT) if self.last_crawl else None
+            }
+
+class TrackerCacheHandler(BaseHTTPRequestHandler):
+    """
+    캐시 서버의 HTTP 요청을 처리합니다.
+    GET /changes?hours=&date=&assignee=&author=, GET /state?at=&fields=&issue=, GET /status, POST /webhook
+    """
+    def send_json(self, status, data):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def has_valid_token(self):
+        token = self.server.token
+        return not token or hmac.compare_digest(self.headers.get(TRACKER_TOKEN_HEADER, ''), token)
+
+    def do_GET(self):
+        if not self.has_valid_token():
+            self.send_json(401, {'error': 'unauthorized'})
+            return
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        store = self.server.store
+
+        if url.path == '/status':
+            self.send_json(200, store.status())
+            return
+        if url.path == '/state':
+            try:
+                when = parser.parse(params['at']) if params.get('at') else datetime.now(KST)
+            except (ValueError, OverflowError) as e:
+                self.send_json(400, {'error': str(e)})
+                return
+            fields = [field for field in params.get('fields', '').split(',') if field]
+            table = store.state_at(when, fields or None, params.get('issue') or None)
+            self.send_json(200, {'state': dataframe_to_rows(table.reset_index()), **store.status()})
+            return
+        if url.path != '/changes':
+            self.send_json(404, {'error': 'not found'})
+            return
+        if store.is_stale():
+            # 수집이 계속 실패하는 중이면 오래된 행으로 답하지 않고 클라이언트가 JIRA에서 직접 수집
+            self.send_json(503, {'error': '캐시가 최신 상태가 아닙니다.', **store.status()})
+            return
+
+        try:
+            hours = float(params['hours']) if params.get('hours') else None
+            selected_date = parser.parse(params['date']).date() if params.get('date') else None
+            result = store.query(hours, selected_date, params.get('assignee', ''), params.get('author', ''))
+        except ValueError as e:
+            self.send_json(400, {'error': str(e)})
+            return
+
+        if result is None:
+            # 보관 범위를 벗어난 조회는 클라이언트가 JIRA에서 직접 수집
+            self.send_json(416, {'error': '조회 범위가 캐시 보관 범위를 벗어났습니다.', **store.status()})
+            return
+        self.send_json(200, {'rows': dataframe_to_rows(result), **store.status()})
+
+    def do_POST(self):
+        if urlparse(self.path).path != '/webhook':
+            self.send_json(404, {'error': 'not found'})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            body = self.rfile.read(length)
+        except ValueError:
+            self.send_json(400, {'error': 'invalid payload'})
+            return
+
+        # 토큰 헤더 또는 JIRA 웹훅 서명(WEBHOOK_SECRET) 중 하나가 맞아야 저장소에 반영
+        webhook_secret = self.server.webhook_secret
+        if webhook_secret and verify_webhook_signature(webhook_secret, body, self.headers.get('X-Hub-Signature')):
+            authorized = True
+        elif self.server.token:
+            authorized = self.has_valid_token()
+        else:
+            authorized = not webhook_secret
+        if not authorized:
+            self.send_json(401, {'error': 'unauthorized'})
+            return
+
+        try:
+            payload = json.loads(body.decode('utf-8'))
+        except (ValueError, UnicodeDecodeError):
+            payload = None
+        if not isinstance(payload, dict):
+            self.send_json(400, {'error': 'invalid payload'})
+            return
+        changes = webhook_payload_to_changes(payload, self.server.jira_url, self.server.fields_to_track)
+        if changes:
+            self.server.store.merge(changes_to_dataframe(changes))
+        self.send_json(200, {'accepted': len(changes)})
+
+    def log_message(self, format, *args):
+        print(f"[cache-server] {self.address_string()} {format % args}")
+
+class TrackerCacheServer:
+    """
+    크롤러 하나로 JIRA 변경 이력을 수집해 ChangeStore에 보관하고, 여러 트래커 클라이언트의 조회에 응답합니다.
+    처음에는 보관 기간 전체를 수집하고, 이후에는 crawl_interval_minutes마다 최근 구간만 다시 수집합니다.
+    jira_credentials.json의 TRACKER_SERVER_TOKEN이 있으면 모든 요청에 같은 토큰 헤더를 요구하며,
+    이 PC 밖에서 접속 가능한 주소로 열 때는 토큰이 반드시 필요합니다.
+    """
+    def __init__(self, host=TRACKER_SERVER_HOST, port=TRACKER_SERVER_PORT,
+                 crawl_interval_minutes=TRACKER_CRAWL_INTERVAL_MINUTES, retention_hours=TRACKER_RETENTION_HOURS):
+        current_credentials = load_jira_credentials() or {}
+        token = current_credentials.get('TRACKER_SERVER_TOKEN')
+        if not token and host not in ('127.0.0.1', 'localhost', '::1'):
+            raise Exception("외부에서 접속 가능한 주소로 실행하려면 jira_credentials.json에 TRACKER_SERVER_TOKEN을 설정해주세요.")
+
+        self.crawl_interval_minutes = crawl_interval_minutes
+        self.store = ChangeStore(retention_hours, crawl_interval_minutes)
+        self.stop_event = threading.Event()
+        self.server = ThreadingHTTPServer((host, port), TrackerCacheHandler)
+        self.server.daemon_threads = True
+        self.server.store = self.store
+        self.server.token = token
+        self.server.webhook_secret = current_credentials.get('WEBHOOK_SECRET')
+        self.server.jira_url = current_credentials.get('JIRA_URL')
+        self.server.fields_to_track = load_fields_to_track()
+        self.crawler_thread = None
+
+    @property
+    def address(self):
+        return self.server.server_address[:2]
+
+    def crawl_once(self, hours):
+        crawl_until = datetime.now(KST)
+        crawl_start = crawl_until - timedelta(hours=hours)
+        df = run_jira_tracker(hours, False, '', '', None)
+        self.store.merge(df, covered_from=crawl_start, covered_until=crawl_until)
+
+    def crawl_loop(self):
+        last_success = None
+        while not self.stop_event.is_set():
+            try:
+                # 처음에는 보관 기간 전체, 이후에는 마지막 성공 시각부터 수집 간격만큼 겹쳐서 다시 조회해 누락을 방지
+                crawl_started = datetime.now(KST)
+                if last_success is None:
+                    hours = self.store.retention_hours
+                else:
+                    hours = (crawl_started - last_success).total_seconds() / 3600 + self.crawl_interval_minutes / 60
+                self.crawl_once(min(hours, self.store.retention_hours))
+                last_success = crawl_started
+                print(f"[cache-server] 수집 완료: {self.store.status()}")
+            except Exception as e:
+                print(f"[cache-server] 수집 중 오류 발생: {e}")
+                traceback.print_exc()
+            self.stop_event.wait(self.crawl_interval_minutes * 60)
+
+    def start(self):
+        self.crawler_thread = threading.Thread(target=self.crawl_loop, daemon=True)
+        self.crawler_thread.start()
+
+    def serve_forever(self):
+        self.start()
+        host, port = self.address
+        print(f"[cache-server] http://{host}:{port}/ 에서 조회 요청을 받습니다.")
+        try:
+            self.server.serve_forever()
+        finally:
+            self.stop_event.set()
+            self.server.server_close()
+
+def query_tracker_server(server_url, hours, assignee_name, author_name, selected_date, token=None):
+    """
+    공유 캐시 서버에 변경 이력을 조회합니다. token이 있으면 토큰 헤더로 보냅니다.
+    요청한 범위를 서버가 보관하고 있지 않거나 서버의 수집이 끊겨 최신이 아니면 None을 반환하므로 호출한 쪽에서 JIRA를 직접 조회합니다.
+    """
+    params = {'assignee': assignee_name, 'author': author_name}
+    if selected_date:
+        params['date'] = selected_date.strftime('%Y-%m-%d')
+    else:
+        params['hours'] = hours
+    try:
+        headers = {TRACKER_TOKEN_HEADER: token} if token else {}
+        response = requests.get(f"{server_url.rstrip('/')}/changes", params=params, headers=headers, timeout=30)
+    except requests.RequestException as e:
+        print(f"캐시 서버 조회 중 오류 발생, JIRA에서 직접 수집합니다: {e}")
+        return None
+    if response.status_code in (416, 503):
+        # 보관 범위 밖이거나 캐시가 최신이 아니면 JIRA에서 직접 수집
+        return None
+    if response.status_code != 200:
+        raise Exception(f"캐시 서버 조회 중 오류가 발생했습니다.\n상태 코드: {response.status_code}\n{response.text}")
+    return changes_to_dataframe(json_loads(response.content)['rows'])
+
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = JiraTrackerApp(root)
-    root.mainloop()
+    arg_parser = argparse.ArgumentParser(description="JIRA Issue Tracker")
+    arg_parser.add_argument('--serve', action='store_true', help="GUI 대신 팀 공유 캐시 서버로 실행")
+    arg_parser.add_argument('--host', default=TRACKER_SERVER_HOST)
+    arg_parser.add_argument('--port', type=int, default=TRACKER_SERVER_PORT)
+    arg_parser.add_argument('--interval', type=float, default=TRACKER_CRAWL_INTERVAL_MINUTES, help="수집 간격 (분)")
+    arg_parser.add_argument('--retention', type=float, default=TRACKER_RETENTION_HOURS, help="보관 기간 (시간)")
+    args = arg_parser.parse_args()
+
+    if args.serve:
+        TrackerCacheServer(args.host, args.port, args.interval, args.retention).serve_forever()
+    else:
+        root = tk.Tk()
+        app = JiraTrackerApp(root)
+        root.mainloop()